@@ -87,11 +87,13 @@ class NBAFantasyChatbot:
         # Strategy 2: If no match, try partial matching with word parts
         if player_data.empty:
             search_parts = player_name.lower().split()
-            for _, row in self.df.iterrows():
-                player_name_lower = row['Player'].lower()
-                if all(part in player_name_lower for part in search_parts):
-                    player_data = self.df[self.df['Player'] == row['Player']]
-                    break
+            player_names_lower = self.df['Player'].str.lower()
+            matches = pd.Series(True, index=self.df.index)
+            for part in search_parts:
+                matches &= player_names_lower.str.contains(part, na=False, regex=False)
+            if matches.any():
+                first_match = self.df.loc[matches.idxmax(), 'Player']
+                player_data = self.df[self.df['Player'] == first_match]
         
         # Strategy 3: If still no match, try fuzzy matching for common names
         if player_data.empty:
@@ -537,6 +539,7 @@ Just ask me anything about NBA players and fantasy basketball! 🏀
         # Position distribution
         elif 'position' in query_lower and 'distribution' in query_lower:
             pos_counts = self.df['Pos'].value_counts()
+            pos_counts = pos_counts[pos_counts > 0]  # Categorical columns count unused positions too
             response = "**🏀 Position Distribution in NBA:**\n\n"
             for pos, count in pos_counts.items():
                 percentage = (count / len(self.df)) * 100
@@ -553,6 +556,7 @@ Just ask me anything about NBA players and fantasy basketball! 🏀
             
             # Position breakdown of elite players
             elite_pos = elite_players['Pos'].value_counts()
+            elite_pos = elite_pos[elite_pos > 0]
             response += "**Position Breakdown:**\n"
             for pos, count in elite_pos.items():
                 response += f"• **{pos}:** {count} players\n"
@@ -567,7 +571,7 @@ Just ask me anything about NBA players and fantasy basketball! 🏀
         
         # Team analysis
         elif 'team' in query_lower and ('best' in query_lower or 'strongest' in query_lower):
-            team_avg_fantasy = self.df.groupby('Team')['Fantasy_Points'].mean().sort_values(ascending=False)
+            team_avg_fantasy = self.df.groupby('Team', observed=True)['Fantasy_Points'].mean().sort_values(ascending=False)
             response = "**🏆 Teams Ranked by Average Fantasy Points:**\n\n"
             for i, (team, avg_fp) in enumerate(team_avg_fantasy.head(10).items(), 1):
                 response += f"{i}. **{team}:** {avg_fp:.1f} avg FP\n"
@@ -606,7 +610,7 @@ Just ask me anything about NBA players and fantasy basketball! 🏀
         
         # Position scarcity
         elif 'position scarcity' in query_lower or 'scarcity' in query_lower:
-            pos_avg_fantasy = self.df.groupby('Pos')['Fantasy_Points'].mean().sort_values(ascending=False)
+            pos_avg_fantasy = self.df.groupby('Pos', observed=True)['Fantasy_Points'].mean().sort_values(ascending=False)
             response = "**📊 Position Scarcity Analysis:**\n\n"
             response += "**Average Fantasy Points by Position:**\n"
             for pos, avg_fp in pos_avg_fantasy.items():
@@ -3,17 +3,46 @@ Data processing module for NBA Fantasy Dashboard
 Handles data loading, cleaning, and preprocessing
 """
 
+import os
+import hashlib
 import pandas as pd
+import pyarrow.parquet as pq
 import numpy as np
-from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import KMeans
 import warnings
+from utils import (calculate_fantasy_points_vec, calculate_per_vec, calculate_usage_rate_vec,
+                   calculate_weighted_fantasy_score_vec, compute_all_metrics)
 warnings.filterwarnings('ignore')
 
+# Parquet schema metadata key holding the SHA-256 of the Excel file a copy was made from
+SOURCE_HASH_KEY = b'source_sha256'
+
+def file_sha256(path):
+    """Hex SHA-256 digest of a file's contents"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def read_table(excel_path):
+    """Read a data table, preferring the Parquet copy next to the Excel file
+    
+    The Parquet copies are generated by tools/xlsx_to_parquet.py and load far
+    faster than parsing the workbook. Each copy records a hash of its source
+    workbook; if the workbook no longer matches, the Excel file is read instead.
+    """
+    parquet_path = os.path.splitext(excel_path)[0] + '.parquet'
+    if os.path.exists(parquet_path):
+        if not os.path.exists(excel_path):
+            return pd.read_parquet(parquet_path)
+        metadata = pq.read_schema(parquet_path).metadata or {}
+        if metadata.get(SOURCE_HASH_KEY, b'').decode() == file_sha256(excel_path):
+            return pd.read_parquet(parquet_path)
+        print(f"Warning: {parquet_path} does not match {excel_path}; reading the Excel file. "
+              f"Run tools/xlsx_to_parquet.py to refresh it.")
+    return pd.read_excel(excel_path)
+
 def load_bpm_coefficients():
     """Load Box Plus Minus coefficients from the interpolation table"""
     try:
-        bpm_df = pd.read_excel('Interpolation table values.xlsx')
+        bpm_df = read_table('Interpolation table values.xlsx')
         
         # Create a dictionary mapping position to coefficients
         bpm_coefficients = {}
@@ -60,65 +89,33 @@ def load_bpm_coefficients():
             'C': {'PTS': 0.86, '3P': 0.389, 'AST': 1.034, 'TOV': -0.964, 'ORB': 0.181, 'DRB': 0.181, 'STL': 1.008, 'BLK': 0.703, 'PF': -0.367, 'FGA': -0.780, 'FTA': -0.343}
         }
 
+BPM_STATS = ['PTS', '3P', 'AST', 'TOV', 'ORB', 'DRB', 'STL', 'BLK', 'PF', 'FGA', 'FTA']
+
 def calculate_box_plus_minus(df, bpm_coefficients):
     """Calculate Box Plus Minus for each player based on their position"""
-    bpm_values = []
+    # Each player picks up their position's row of a coefficient matrix
+    # (PG when the position isn't listed); the weighted sum then runs one
+    # stat at a time over whole columns instead of player by player
+    positions = list(bpm_coefficients)
+    coeff_matrix = np.array([[bpm_coefficients[pos][stat] for stat in BPM_STATS] for pos in positions])
+    position_rows = (df['Pos'].map({pos: i for i, pos in enumerate(positions)})
+                     .fillna(positions.index('PG')).to_numpy(dtype=int))
+    player_coeffs = coeff_matrix[position_rows]
     
-    for _, player in df.iterrows():
-        position = player['Pos']
-        
-        # Get coefficients for the player's position
-        if position in bpm_coefficients:
-            coeffs = bpm_coefficients[position]
-        else:
-            # Default to PG coefficients if position not found
-            coeffs = bpm_coefficients['PG']
-        
-        # Calculate BPM using the formula: sum of (stat * coefficient)
-        bpm = (
-            player['PTS'] * coeffs['PTS'] +
-            player['3P'] * coeffs['3P'] +
-            player['AST'] * coeffs['AST'] +
-            player['TOV'] * coeffs['TOV'] +
-            player['ORB'] * coeffs['ORB'] +
-            player['DRB'] * coeffs['DRB'] +
-            player['STL'] * coeffs['STL'] +
-            player['BLK'] * coeffs['BLK'] +
-            player['PF'] * coeffs['PF'] +
-            player['FGA'] * coeffs['FGA'] +
-            player['FTA'] * coeffs['FTA']
-        )
-        
-        bpm_values.append(bpm)
+    bpm = np.zeros(len(df))
+    for i, stat in enumerate(BPM_STATS):
+        bpm = bpm + df[stat].to_numpy(dtype=float) * player_coeffs[:, i]
     
-    return np.array(bpm_values)
+    return bpm
 
 def calculate_fantasy_points_with_weights(df, weights=None):
-    """Calculate fantasy points using custom weights"""
-    if weights is None:
-        # Default weights
-        weights = {
-            'PTS': 1.0,
-            'TRB': 1.25,
-            'AST': 1.5,
-            'STL': 2.0,
-            'BLK': 2.0,
-            'TOV': -1.0
-        }
-    
-    return (
-        df['PTS'] * weights['PTS'] +
-        df['TRB'] * weights['TRB'] +
-        df['AST'] * weights['AST'] +
-        df['STL'] * weights['STL'] +
-        df['BLK'] * weights['BLK'] +
-        df['TOV'] * weights['TOV']
-    )
+    """Calculate fantasy points using custom weights (standard scoring by default)"""
+    return calculate_fantasy_points_vec(df, weights)
 
 def load_data():
     """Load and preprocess the NBA player data"""
     try:
-        df = pd.read_excel('2024NBAplayerStats.xlsx')
+        df = read_table('2024NBAplayerStats.xlsx')
         
         # Clean the data
         df = df.dropna(subset=['Player', 'PTS', 'TRB', 'AST'])
@@ -130,8 +127,8 @@ def load_data():
         df['Fantasy_Points'] = calculate_fantasy_points_with_weights(df)
         
         # Calculate efficiency metrics
-        df['PER'] = df['PTS'] + df['TRB'] + df['AST'] + df['STL'] + df['BLK'] - df['TOV']
-        df['Usage_Rate'] = (df['FGA'] + df['FTA'] * 0.44 + df['AST']) / df['MP'] * 100
+        df['PER'] = calculate_per_vec(df)
+        df['Usage_Rate'] = calculate_usage_rate_vec(df)
         
         # Calculate advanced metrics with error handling
         # Note: eFG% already exists in the Excel file, so we don't need to calculate it
@@ -183,6 +180,22 @@ def load_data():
         print(f"Error loading data: {e}")
         return pd.DataFrame()
 
+def downcast_numeric_columns(df):
+    """Downcast integer columns to the smallest fitting type"""
+    # Float columns stay float64: float32 stats round differently at .x5
+    # boundaries, and metrics recomputed from them would disagree with the
+    # load-time values between views
+    df = df.copy()
+    for col in df.select_dtypes(include='integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+def categorize_columns(df, columns=('Pos', 'Team')):
+    """Store low-cardinality text columns as pandas categoricals"""
+    # Equality filters then compare small integer codes instead of strings.
+    # Groupbys on these columns need observed=True to skip empty categories
+    return df.astype({col: 'category' for col in columns if col in df.columns})
+
 def handle_duplicate_players(df):
     """Handle players who played for multiple teams"""
     # Create a copy to work with
@@ -231,63 +244,71 @@ def create_player_clusters(df):
 
 def apply_filters(df, position='All', team='All', age_range=(19, 40), min_games=20, ppg_range=(0.0, 50.0), fantasy_weights=None):
     """Apply filters to the dataset"""
-    filtered_df = df.copy()
+    # Combine every filter into a single boolean mask so the frame is only
+    # sliced once, instead of copying it and re-slicing it per filter
+    mask = (
+        df['Age'].between(age_range[0], age_range[1]) &
+        (df['G'] >= min_games) &
+        df['PTS'].between(ppg_range[0], ppg_range[1])
+    )
     
     if position != 'All':
-        filtered_df = filtered_df[filtered_df['Pos'] == position]
+        mask &= df['Pos'] == position
     
     if team != 'All':
-        filtered_df = filtered_df[filtered_df['Team'] == team]
+        mask &= df['Team'] == team
     
-    filtered_df = filtered_df[
-        (filtered_df['Age'] >= age_range[0]) & 
-        (filtered_df['Age'] <= age_range[1]) &
-        (filtered_df['G'] >= min_games) &
-        (filtered_df['PTS'] >= ppg_range[0]) &
-        (filtered_df['PTS'] <= ppg_range[1])
-    ]
+    filtered_df = df[mask]
     
     # Recalculate fantasy points with custom weights if provided
     if fantasy_weights is not None:
-        filtered_df['Fantasy_Points'] = calculate_fantasy_points_with_weights(filtered_df, fantasy_weights)
+        filtered_df = filtered_df.assign(
+            Fantasy_Points=calculate_fantasy_points_with_weights(filtered_df, fantasy_weights)
+        )
     
     return filtered_df
 
 def create_fantasy_ranking(df, min_games=20, fantasy_weights=None):
     """Create fantasy ranking based on fantasy points (primary) and other factors"""
     # Filter players with minimum games
-    df_filtered = df[df['G'] >= min_games].copy()
+    df_filtered = df[df['G'] >= min_games]
     
-    # Recalculate fantasy points with custom weights if provided
+    # Recalculate fantasy points with custom weights if provided, along with
+    # the weighted fantasy score in the same pass
     if fantasy_weights is not None:
-        df_filtered['Fantasy_Points'] = calculate_fantasy_points_with_weights(df_filtered, fantasy_weights)
-    
-    # Calculate weighted fantasy score
-    df_filtered['Weighted_Fantasy_Score'] = (
-        df_filtered['Fantasy_Points'] * 0.4 +
-        df_filtered['PER'] * 0.3 +
-        df_filtered['Usage_Rate'] * 0.2 +
-        (df_filtered['FG%'] + df_filtered['3P%'] + df_filtered['FT%']) / 3 * 0.1
-    )
+        df_filtered = compute_all_metrics(df_filtered, fantasy_weights)
+    else:
+        df_filtered = df_filtered.assign(Weighted_Fantasy_Score=calculate_weighted_fantasy_score_vec(df_filtered))
     
     # Rank players by Fantasy Points ONLY (as requested)
-    df_filtered = df_filtered.sort_values('Fantasy_Points', ascending=False)
+    df_filtered = df_filtered.sort_values('Fantasy_Points', ascending=False, kind='stable')
     df_filtered['Fantasy_Rank'] = range(1, len(df_filtered) + 1)
     
     return df_filtered
 
 def get_similar_players(df, player_name, player_type, top_n=5):
     """Get similar players based on player type and fantasy points"""
-    similar_players = df[
-        (df['Player_Type'] == player_type) &
-        (df['Player'] != player_name)
-    ].nlargest(top_n, 'Fantasy_Points')
+    # Work on the raw column arrays: one vectorized mask and a stable
+    # argsort of the candidates, then a single positional take
+    fantasy_points = df['Fantasy_Points'].to_numpy()
+    candidates = np.flatnonzero(
+        (df['Player_Type'].to_numpy() == player_type) &
+        (df['Player'].to_numpy() != player_name)
+    )
+    order = np.argsort(-fantasy_points[candidates], kind='stable')[:top_n]
+    similar_players = df.iloc[candidates[order]]
     
     return similar_players
 
+def get_players_by_type(df):
+    """Group players by player type, each group sorted by fantasy points"""
+    # One stable sort up front; groupby keeps that order within each group
+    ranked = df.sort_values('Fantasy_Points', ascending=False, kind='stable')
+    return {player_type: group for player_type, group in ranked.groupby('Player_Type', sort=False)}
+
 def get_team_stats(df):
     """Calculate team statistics"""
-    team_stats = df.groupby('Team').agg({
+    team_stats = df.groupby('Team', observed=True).agg({
         'Fantasy_Points': ['mean', 'sum'],
         'Player': 'count'
     }).round(1)
@@ -299,7 +320,7 @@ def get_team_stats(df):
 
 def get_position_stats(df):
     """Calculate position-based statistics"""
-    position_stats = df.groupby('Pos').agg({
+    position_stats = df.groupby('Pos', observed=True).agg({
         'Fantasy_Points': 'mean',
         'PTS': 'mean',
         'TRB': 'mean',
@@ -1,11 +1,14 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import plotly.io as pio
+from html import escape
+from concurrent.futures import ThreadPoolExecutor
 
 # Import custom modules
 from data_processing import (
-    load_data, apply_filters, create_fantasy_ranking, 
-    get_similar_players, get_team_stats, get_position_stats
+    load_data, downcast_numeric_columns, categorize_columns, apply_filters, create_fantasy_ranking, 
+    get_players_by_type, get_team_stats, get_position_stats
 )
 from visualizations import (
     create_fantasy_distribution_chart, create_top_players_chart,
@@ -14,13 +17,12 @@ from visualizations import (
     create_position_analysis_chart, create_team_analysis_chart,
     create_metric_cards_data, create_multi_player_radar_chart,
     create_advanced_stats_comparison_chart, create_advanced_stats_distribution_chart,
-    create_advanced_stats_scatter
+    create_advanced_stats_scatter, get_radar_max_values
 )
 from utils import (
-    get_filter_options, validate_filters, get_player_summary,
-    format_percentage, format_stat, calculate_league_averages
+    get_filter_options, FilterSpec, get_player_summary,
+    format_percentage, format_stat, format_stat_series
 )
-from ai_chatbot import NBAFantasyChatbot
 
 # Page configuration
 st.set_page_config(
@@ -31,7 +33,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -46,6 +48,20 @@ st.markdown("""
         border-radius: 0.5rem;
         border-left: 4px solid #1f77b4;
     }
+    .metric-grid {
+        display: grid;
+        gap: 1rem;
+        margin-bottom: 1rem;
+        color: #262730;
+    }
+    .metric-label {
+        font-size: 0.875rem;
+    }
+    .metric-value {
+        font-size: 1.75rem;
+        font-weight: 600;
+        overflow-wrap: anywhere;
+    }
     .player-card {
         background-color: #ffffff;
         padding: 1rem;
@@ -57,653 +73,916 @@ st.markdown("""
         background-color: white;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 @st.cache_data(ttl=300)  # Cache for 5 minutes to allow for updates
-def get_cached_data(cache_key="v2"):
+def get_cached_data(cache_key="v3"):
     """Get cached data using the data processing module"""
-    return load_data()
+    return categorize_columns(downcast_numeric_columns(load_data()))
 
+@st.cache_data(ttl=300)
+def get_cached_filter_options():
+    """Get sidebar filter options for the cached dataset"""
+    return get_filter_options(get_cached_data())
 
-def main():
-    # Header
-    st.markdown('<h1 class="main-header">🏀 NBA Fantasy League Dashboard</h1>', unsafe_allow_html=True)
+@st.cache_data(ttl=300)
+def get_ai_response(signature, query):
+    """Answer an AI assistant query over the filtered players, once per distinct query"""
+    # Imported here so the chatbot module only loads once the AI Assistant is opened
+    from ai_chatbot import NBAFantasyChatbot
+    return NBAFantasyChatbot(get_filtered_data(signature)).process_query(query)
+
+def get_filter_signature(spec, fantasy_weights):
+    """Build a hashable cache key from validated filters and the fantasy weights"""
+    return (
+        spec.position, spec.team,
+        spec.age_lo, spec.age_hi,
+        spec.min_games,
+        spec.ppg_lo, spec.ppg_hi,
+        tuple((stat, float(weight)) for stat, weight in fantasy_weights.items())
+    )
+
+@st.cache_data(ttl=300)
+def get_filtered_data(signature):
+    """Get the filtered dataset for a filter signature"""
+    position, team, age_min, age_max, min_games, ppg_min, ppg_max, weights = signature
+    return apply_filters(get_cached_data(), position, team, (age_min, age_max),
+                         min_games, (ppg_min, ppg_max), dict(weights))
+
+@st.cache_data(ttl=300)
+def get_player_index(signature):
+    """Get the filtered dataset indexed by player name for fast lookups"""
+    return get_filtered_data(signature).set_index('Player', drop=False)
+
+@st.cache_data(ttl=300)
+def get_player_row(signature, player_name):
+    """Get a single player's row of the filtered dataset"""
+    # Cached per player so a rerun only deserializes one row, not the whole frame
+    return get_player_index(signature).loc[player_name]
+
+@st.cache_data(ttl=300)
+def get_player_stat_tables(signature, player_name):
+    """Get a player's formatted main and advanced Stat/Value tables"""
+    # Formatted once per player rather than cell by cell on every rerun
+    summary = get_player_summary(get_player_row(signature, player_name))
+    return tuple(
+        pd.DataFrame({'Stat': [label for label, _, _ in rows],
+                      'Value': [fmt.format(summary[key]) for _, key, fmt in rows]})
+        for rows in (MAIN_STAT_ROWS, ADVANCED_STAT_ROWS)
+    )
+
+@st.cache_data(ttl=300)
+def get_comparison_table(signature, player_names):
+    """Get the detailed comparison table for players, in selection order"""
+    return (get_player_index(signature)
+            .loc[list(player_names), list(COMPARISON_COLUMNS)]
+            .rename(columns=COMPARISON_COLUMNS))
+
+@st.cache_data(ttl=300)
+def get_player_list(signature):
+    """Get the sorted player names of the filtered dataset"""
+    return sorted(get_filtered_data(signature)['Player'].unique().tolist())
+
+@st.cache_data(ttl=300)
+def get_cached_players_by_type(signature):
+    """Get the filtered players grouped by player type, best fantasy scorers first"""
+    filtered_df = get_filtered_data(signature)
+    return get_players_by_type(filtered_df[['Player', 'Team', 'Player_Type', 'Fantasy_Points']])
+
+@st.cache_data(ttl=300)
+def get_full_ranking(weights):
+    """Get the fantasy ranking of the full dataset for a set of scoring weights"""
+    return create_fantasy_ranking(get_cached_data(), 0, dict(weights))
+
+@st.cache_data(ttl=300)
+def get_ranked_data(signature):
+    """Get the fantasy ranking of the filtered dataset for a filter signature"""
+    # Slice the full ranking instead of re-sorting the filtered view; the
+    # ranking order is kept and the ranks are renumbered within the view
+    ranked_df = get_full_ranking(signature[7])
+    ranked_df = ranked_df[ranked_df.index.isin(get_filtered_data(signature).index)]
+    return ranked_df.assign(Fantasy_Rank=range(1, len(ranked_df) + 1))
+
+@st.cache_data(ttl=300)
+def get_cached_team_stats(signature):
+    """Get team statistics of the filtered dataset for a filter signature"""
+    return get_team_stats(get_filtered_data(signature))
+
+@st.cache_data(ttl=300)
+def get_cached_position_stats(signature):
+    """Get position statistics of the filtered dataset for a filter signature"""
+    return get_position_stats(get_filtered_data(signature))
+
+# Cached chart figures. Figures are stored as Plotly JSON since Figure
+# objects can't be hashed by Streamlit; unchanged filters re-render for free.
+@st.cache_data(ttl=300)
+def get_overview_bundle(signature, top_n):
+    """Get the overview page's metric cards and chart JSON for a filter signature"""
+    # Compute the summaries the overview charts share once up front, so each
+    # chart works from a small precomputed input instead of rescanning the frame
+    filtered_df = get_filtered_data(signature)
+    fantasy_points = filtered_df[['Fantasy_Points']]
+    top_players = filtered_df.nlargest(top_n, 'Fantasy_Points')[['Player', 'Fantasy_Points']]
+    player_type_counts = filtered_df['Player_Type'].value_counts()
     
-    # Load data
-    df = get_cached_data()
+    # The pieces are then independent, and pandas/Plotly release the GIL for
+    # much of their work, so build them in parallel
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        metrics = executor.submit(create_metric_cards_data, filtered_df)
+        distribution = executor.submit(lambda: create_fantasy_distribution_chart(fantasy_points).to_json())
+        top_chart = executor.submit(lambda: create_top_players_chart(top_players, top_n).to_json())
+        player_types = executor.submit(lambda: create_player_type_pie_chart(None, player_type_counts=player_type_counts).to_json())
+        return {
+            'metrics': metrics.result(),
+            'distribution': distribution.result(),
+            'top_players': top_chart.result(),
+            'player_types': player_types.result()
+        }
+
+@st.cache_data(ttl=300)
+def get_radar_maxima(signature):
+    """Get the radar chart normalization maxima of the filtered dataset"""
+    return get_radar_max_values(get_filtered_data(signature))
+
+def _build_player_radar(signature, player_name):
+    player_data = get_player_row(signature, player_name)
+    return create_player_radar_chart(player_data, player_name, get_filtered_data(signature),
+                                     get_radar_maxima(signature))
+
+def _build_multi_player_radar(signature, player_names):
+    player_index = get_player_index(signature)
+    players_data = [player_index.loc[name] for name in player_names]
+    return create_multi_player_radar_chart(players_data, list(player_names), get_filtered_data(signature),
+                                           get_radar_maxima(signature))
+
+def _build_advanced_comparison(signature, player_names, stats):
+    player_index = get_player_index(signature)
+    players_data = [player_index.loc[name] for name in player_names]
+    return create_advanced_stats_comparison_chart(players_data, list(player_names), list(stats))
+
+# Chart builders addressed by chart id; each takes the filter signature
+# followed by the chart's own (hashable) parameters
+CHART_BUILDERS = {
+    'fantasy_vs_efficiency': lambda sig, top_n: create_fantasy_vs_efficiency_scatter(get_ranked_data(sig), top_n),
+    'position_analysis': lambda sig: create_position_analysis_chart(get_cached_position_stats(sig)),
+    'team_analysis': lambda sig, chart_type, top_n: create_team_analysis_chart(get_cached_team_stats(sig), chart_type, top_n),
+    'advanced_distribution': lambda sig, stat: create_advanced_stats_distribution_chart(get_filtered_data(sig), stat),
+    'advanced_scatter': lambda sig, x_stat, y_stat: create_advanced_stats_scatter(get_filtered_data(sig), x_stat, y_stat),
+    'player_radar': _build_player_radar,
+    'multi_player_radar': _build_multi_player_radar,
+    'advanced_comparison': _build_advanced_comparison
+}
+
+@st.cache_data(ttl=300)
+def get_chart_json(chart_id, signature, *params):
+    """Get a chart as Plotly JSON, cached per (chart id, filter signature, params)"""
+    return CHART_BUILDERS[chart_id](signature, *params).to_json()
+
+def get_chart(chart_id, signature, *params):
+    """Get a cached chart as a Plotly figure"""
+    return pio.from_json(get_chart_json(chart_id, signature, *params))
+
+# Plotly config for read-only charts: rendered as static images with no
+# mode bar, which keeps the payload and browser work per rerun down
+STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+# Top picks table columns (source column -> display name) and formats
+TOP_PICKS_COLUMNS = {
+    'Fantasy_Rank': 'Rank',
+    'Player': 'Player',
+    'Team': 'Team',
+    'Pos': 'Position',
+    'Fantasy_Points': 'Fantasy Points',
+    'PTS': 'Points',
+    'TRB': 'Rebounds',
+    'AST': 'Assists',
+    'STL': 'Steals',
+    'BLK': 'Blocks',
+    'FG%': 'FG%',
+    '3P%': '3P%',
+    'FT%': 'FT%'
+}
+TOP_PICKS_PERCENT_COLUMNS = ['FG%', '3P%', 'FT%']
+TOP_PICKS_COLUMN_CONFIG = {
+    'Fantasy Points': st.column_config.NumberColumn(format="%.1f"),
+    'Points': st.column_config.NumberColumn(format="%.1f"),
+    'Rebounds': st.column_config.NumberColumn(format="%.1f"),
+    'Assists': st.column_config.NumberColumn(format="%.1f"),
+    'Steals': st.column_config.NumberColumn(format="%.1f"),
+    'Blocks': st.column_config.NumberColumn(format="%.1f"),
+    'FG%': st.column_config.NumberColumn(format="%.1f%%"),
+    '3P%': st.column_config.NumberColumn(format="%.1f%%"),
+    'FT%': st.column_config.NumberColumn(format="%.1f%%")
+}
+
+# Detailed comparison table columns (source column -> display name) and formats
+COMPARISON_COLUMNS = {
+    'Player': 'Player',
+    'Team': 'Team',
+    'Pos': 'Position',
+    'Fantasy_Points': 'Fantasy Points',
+    'PTS': 'Points',
+    'TRB': 'Rebounds',
+    'AST': 'Assists',
+    'STL': 'Steals',
+    'BLK': 'Blocks',
+    'FG%': 'FG%',
+    '3P%': '3P%',
+    'FT%': 'FT%',
+    'eFG%': 'eFG%',
+    'TS%': 'TS%',
+    'AST_TOV_Ratio': 'AST/TOV',
+    'hAST%': 'hAST%',
+    'TOV%': 'TOV%',
+    'Game_Score': 'Game Score',
+    'BPM': 'BPM'
+}
+COMPARISON_FORMATS = {
+    'Fantasy Points': '{:.1f}',
+    'Points': '{:.1f}',
+    'Rebounds': '{:.1f}',
+    'Assists': '{:.1f}',
+    'Steals': '{:.1f}',
+    'Blocks': '{:.1f}',
+    'FG%': '{:.1%}',
+    '3P%': '{:.1%}',
+    'FT%': '{:.1%}',
+    'eFG%': '{:.1%}',
+    'TS%': '{:.1%}',
+    'AST/TOV': '{:.2f}',
+    'hAST%': '{:.1%}',
+    'TOV%': '{:.1%}',
+    'Game Score': '{:.1f}',
+    'BPM': '{:.1f}'
+}
+
+# Player Analysis stat tables: (label, player summary key, format)
+MAIN_STAT_ROWS = [
+    ('Fantasy Points', 'fantasy_points', '{:.1f}'),
+    ('Points', 'points', '{:.1f}'),
+    ('Rebounds', 'rebounds', '{:.1f}'),
+    ('Assists', 'assists', '{:.1f}'),
+    ('Steals', 'steals', '{:.1f}'),
+    ('Blocks', 'blocks', '{:.1f}'),
+    ('Turnovers', 'turnovers', '{:.1f}'),
+    ('FG%', 'fg_percentage', '{:.1%}'),
+    ('3P%', 'three_p_percentage', '{:.1%}'),
+    ('FT%', 'ft_percentage', '{:.1%}'),
+    ('Minutes', 'minutes', '{:.1f}')
+]
+ADVANCED_STAT_ROWS = [
+    ('eFG%', 'efg_percentage', '{:.1%}'),
+    ('TS%', 'ts_percentage', '{:.1%}'),
+    ('FTR', 'ftr', '{:.3f}'),
+    ('AST/TOV Ratio', 'ast_tov_ratio', '{:.2f}'),
+    ('hAST%', 'hast_percentage', '{:.1%}'),
+    ('TOV%', 'tov_percentage', '{:.1%}'),
+    ('Game Score', 'game_score', '{:.1f}'),
+    ('BPM', 'bpm', '{:.1f}')
+]
+
+# Views with their own widgets are fragments, so interacting with them
+# reruns only that view rather than the whole script
+VIEWS = ["📊 Overview", "🎯 Top Picks", "📈 Player Analysis", "⚖️ Player Comparison", "🔍 Advanced Stats", "🤖 AI Assistant", "👨‍💻 About the Author"]
+
+# Player classification summary shown under the player type pie chart
+PLAYER_TYPES_EXPLANATION = """
+Our player classification system uses rule-based categorization to ensure every player is properly classified:
+
+**🎯 Point Guards (PG) & Shooting Guards (SG)**:
+- **Playmaking Guard**
+- **Defensive Guard**
+- **Scoring Guard**
+
+**🔥 Small Forwards (SF)**:
+- **Wing Defender**
+- **Wing Scorer**
+- **3&D Player**
+
+**🏀 Power Forwards (PF) & Centers (C)**:
+- **Playmaking Big**
+- **Rim Protector**
+- **Glass Cleaner**"""
+
+# Page footer
+FOOTER_HTML = """
+<div style='text-align: center; color: #666;'>
+    <p>🏀 NBA Fantasy League Dashboard | Built with Streamlit & Plotly</p>
+    <p>Data: 2024 NBA Player Statistics | Fantasy scoring: Customizable weights in sidebar</p>
+</div>
+"""
+
+def metric_grid_html(metrics, columns=4):
+    """Build a single HTML grid of metric cards from (label, value) pairs"""
+    # One markdown element instead of one st.metric (and column) per value.
+    # At most `columns` cards per row, wrapping onto more rows once a card
+    # would be narrower than 10rem, like st.columns stacking on small screens
+    cards = ''.join(
+        f'<div class="metric-card"><div class="metric-label">{escape(str(label))}</div>'
+        f'<div class="metric-value">{escape(str(value))}</div></div>'
+        for label, value in metrics
+    )
+    min_width = f"max(10rem, calc((100% - {columns - 1}rem) / {columns}))"
+    return (f'<div class="metric-grid" style="grid-template-columns: repeat(auto-fit, minmax({min_width}, 1fr));">'
+            f'{cards}</div>')
+
+def render_overview(filter_signature):
+    """Render the league overview page"""
+    st.header("📊 League Overview")
     
-    if df.empty:
-        st.error("Failed to load data. Please check if the Excel file exists.")
-        return
+    # Get metrics and chart data
+    overview = get_overview_bundle(filter_signature, 10)
+    metrics = overview['metrics']
     
-    # Get filter options
-    try:
-        filter_options = get_filter_options(df)
-    except Exception as e:
-        st.error(f"Error getting filter options: {e}")
-        return
+    # Key metrics
+    st.markdown(metric_grid_html([
+        ("Total Players", metrics['total_players']),
+        ("Avg Fantasy Points", format_stat(metrics['avg_fantasy'])),
+        ("Top Scorer", metrics['top_scorer']),
+        ("Most Efficient", metrics['most_efficient']),
+    ]), unsafe_allow_html=True)
     
-    # Sidebar filters
-    st.sidebar.header("🔍 Filters")
+    # Fantasy points distribution
+    col1, col2 = st.columns(2)
     
-    # Position filter
-    selected_pos = st.sidebar.selectbox("Position", filter_options['positions'])
+    with col1:
+        fig = pio.from_json(overview['distribution'])
+        st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
     
-    # Team filter
-    selected_team = st.sidebar.selectbox("Team", filter_options['teams'])
+    with col2:
+        fig = pio.from_json(overview['top_players'])
+        st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
     
-    # Age range
-    age_range = st.sidebar.slider("Age Range", 
-                                 filter_options['age_range'][0], 
-                                 filter_options['age_range'][1], 
-                                 filter_options['age_range'])
+    # Player type distribution
+    fig = pio.from_json(overview['player_types'])
+    st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
     
-    # Minimum games played
-    min_games = st.sidebar.slider("Minimum Games Played", 
-                                 filter_options['games_range'][0], 
-                                 filter_options['games_range'][1], 
-                                 20)
+    # Player Type Distribution Explanation
+    st.subheader("📋 Player Type Distribution Explanation")
+    st.markdown(PLAYER_TYPES_EXPLANATION, unsafe_allow_html=True)
+
+@st.fragment
+def render_top_picks(filter_signature):
+    """Render the top fantasy picks page"""
+    st.header("🎯 Top Fantasy Picks")
     
-    # Points per game range - with error handling
-    try:
-        ppg_range = st.sidebar.slider("Points Per Game Range", 
-                                     filter_options['ppg_range'][0], 
-                                     filter_options['ppg_range'][1], 
-                                     filter_options['ppg_range'])
-    except KeyError:
-        # Fallback if ppg_range is not available
-        ppg_min, ppg_max = 0.0, 50.0
-        if 'PTS' in df.columns:
-            ppg_min, ppg_max = 0.0, float(df['PTS'].max())
-        ppg_range = st.sidebar.slider("Points Per Game Range", 
-                                     ppg_min, ppg_max, (ppg_min, ppg_max))
-    
-    # Fantasy scoring weights customization
-    st.sidebar.header("⚙️ Fantasy Scoring Weights")
-    st.sidebar.write("Customize how much each stat is worth in fantasy points:")
-    
-    pts_weight = st.sidebar.number_input("Points Weight", min_value=0.0, max_value=5.0, value=1.0, step=0.1)
-    reb_weight = st.sidebar.number_input("Rebounds Weight", min_value=0.0, max_value=5.0, value=1.25, step=0.1)
-    ast_weight = st.sidebar.number_input("Assists Weight", min_value=0.0, max_value=5.0, value=1.5, step=0.1)
-    stl_weight = st.sidebar.number_input("Steals Weight", min_value=0.0, max_value=5.0, value=2.0, step=0.1)
-    blk_weight = st.sidebar.number_input("Blocks Weight", min_value=0.0, max_value=5.0, value=2.0, step=0.1)
-    tov_weight = st.sidebar.number_input("Turnovers Weight (negative)", min_value=-5.0, max_value=0.0, value=-1.0, step=0.1)
+    # Create fantasy ranking
+    ranked_df = get_ranked_data(filter_signature)
     
-    # Display current formula
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("**Current Formula:**")
-    st.sidebar.markdown(f"PTS({pts_weight}) + TRB({reb_weight}) + AST({ast_weight}) + STL({stl_weight}) + BLK({blk_weight}) + TOV({tov_weight})")
+    # Display top picks
+    st.subheader("🏆 Top 20 Fantasy Picks")
     
-    # Store weights in session state
-    fantasy_weights = {
-        'PTS': pts_weight,
-        'TRB': reb_weight,
-        'AST': ast_weight,
-        'STL': stl_weight,
-        'BLK': blk_weight,
-        'TOV': tov_weight
-    }
-    st.session_state.fantasy_weights = fantasy_weights
+    top_20 = ranked_df.head(20)
+    top_20_view = top_20[list(TOP_PICKS_COLUMNS)].rename(columns=TOP_PICKS_COLUMNS)
+    top_20_view[TOP_PICKS_PERCENT_COLUMNS] = top_20_view[TOP_PICKS_PERCENT_COLUMNS] * 100
     
-    # Validate filters
-    if not validate_filters(selected_pos, selected_team, age_range, min_games, ppg_range):
-        st.error("Invalid filter settings. Please check your selections.")
-        return
+    # One table for all 20 picks, formatted client-side through column_config;
+    # details are only built for the selected row. The key follows the
+    # filters so a selection never outlives the rows it was made on
+    selection = st.dataframe(top_20_view, column_config=TOP_PICKS_COLUMN_CONFIG, use_container_width=True,
+                             hide_index=True, on_select="rerun", selection_mode="single-row",
+                             key=f"top_picks_table_{hash(filter_signature)}")
+    st.caption("Select a player in the table to see their details.")
     
-    # Apply filters
-    filtered_df = apply_filters(df, selected_pos, selected_team, age_range, min_games, ppg_range, fantasy_weights)
+    selected_rows = selection.selection.rows
+    if selected_rows and selected_rows[0] < len(top_20):
+        player = top_20.iloc[selected_rows[0]]
+        player_summary = get_player_summary(player)
+        st.markdown(f"#### #{player['Fantasy_Rank']} {player_summary['name']} ({player_summary['team']}) - {player_summary['position']}")
+        st.markdown(metric_grid_html([
+            ("Fantasy Points", format_stat(player_summary['fantasy_points'])),
+            ("Assists", format_stat(player_summary['assists'])),
+            ("FG%", format_percentage(player_summary['fg_percentage'])),
+            ("Points", format_stat(player_summary['points'])),
+            ("Steals", format_stat(player_summary['steals'])),
+            ("3P%", format_percentage(player_summary['three_p_percentage'])),
+            ("Rebounds", format_stat(player_summary['rebounds'])),
+            ("Blocks", format_stat(player_summary['blocks'])),
+            ("FT%", format_percentage(player_summary['ft_percentage'])),
+        ], columns=3), unsafe_allow_html=True)
+        
+        st.write(f"**Player Type:** {player_summary['player_type']}")
+        st.write(f"**Games Played:** {player_summary['games']}")
+        st.write(f"**Minutes per Game:** {format_stat(player_summary['minutes'])}")
     
-    # Main content tabs
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs(["📊 Overview", "🎯 Top Picks", "📈 Player Analysis", "⚖️ Player Comparison", "🔍 Advanced Stats", "🤖 AI Assistant", "👨‍💻 About the Author"])
+    # Fantasy points vs efficiency scatter plot
+    fig = get_chart('fantasy_vs_efficiency', filter_signature, 50)
+    st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def render_player_analysis(filter_signature):
+    """Render the single player analysis page"""
+    st.header("📈 Player Analysis")
+    
+    # Player search
+    player_search = st.selectbox("Select a player to analyze:", 
+                               [''] + get_player_list(filter_signature))
     
-    with tab1:
-        st.header("📊 League Overview")
+    if player_search:
+        player_data = get_player_row(filter_signature, player_search)
+        player_summary = get_player_summary(player_data)
         
-        # Get metrics data
-        metrics = create_metric_cards_data(filtered_df)
+        st.subheader(f"📊 {player_search} Analysis")
         
-        # Key metrics
-        col1, col2, col3, col4 = st.columns(4)
+        # Basic info section
+        col1, col2 = st.columns([1, 2])
         
         with col1:
-            st.metric("Total Players", metrics['total_players'])
+            st.metric("Team", player_summary['team'])
+            st.metric("Position", player_summary['position'])
+            st.metric("Age", player_summary['age'])
+            st.metric("Games Played", player_summary['games'])
+            st.metric("Player Type", player_summary['player_type'])
         
         with col2:
-            st.metric("Avg Fantasy Points", format_stat(metrics['avg_fantasy']))
-        
-        with col3:
-            st.metric("Top Scorer", metrics['top_scorer'])
+            # Performance radar chart
+            fig = get_chart('player_radar', filter_signature, player_search)
+            st.plotly_chart(fig, use_container_width=True)
         
-        with col4:
-            st.metric("Most Efficient", metrics['most_efficient'])
+        # Main and advanced stats, each rendered as a single Stat/Value table
+        main_stats, advanced_stats = get_player_stat_tables(filter_signature, player_search)
         
-        # Fantasy points distribution
         col1, col2 = st.columns(2)
         
         with col1:
-            fig = create_fantasy_distribution_chart(filtered_df)
-            st.plotly_chart(fig, use_container_width=True)
+            st.subheader("📊 Main Statistics")
+            st.dataframe(main_stats, hide_index=True, use_container_width=True)
         
         with col2:
-            fig = create_top_players_chart(filtered_df, 10)
-            st.plotly_chart(fig, use_container_width=True)
+            st.subheader("🔬 Advanced Statistics")
+            st.dataframe(advanced_stats, hide_index=True, use_container_width=True)
+        
+        # Similar players
+        st.subheader("🔍 Similar Players")
+        same_type = get_cached_players_by_type(filter_signature)[player_data['Player_Type']]
+        similar_players = same_type[same_type['Player'] != player_search].head(5)
+        
+        similar_lines = ("• **" + similar_players['Player'] + "** (" + similar_players['Team'].astype(str) + ") - " +
+                         format_stat_series(similar_players['Fantasy_Points']) + " fantasy points")
+        st.markdown("  \n".join(similar_lines))
+
+@st.fragment
+def render_player_comparison(filter_signature):
+    """Render the player comparison page"""
+    st.header("⚖️ Player Comparison")
+    
+    # Player selection for comparison
+    st.subheader("Select Players to Compare (Up to 5)")
+    
+    # Get list of players for selection
+    player_list = get_player_list(filter_signature)
+    
+    selected_players = st.multiselect("Players", player_list, max_selections=5,
+                                      placeholder="Choose up to 5 players")
+    
+    if len(selected_players) >= 2:
+        # Get player data
+        player_names = tuple(selected_players)
+        
+        # Display comparison
+        st.subheader("📊 Player Comparison")
+        
+        # Radar chart comparison
+        fig_radar = get_chart('multi_player_radar', filter_signature, player_names)
+        st.plotly_chart(fig_radar, use_container_width=True)
         
-        # Player type distribution
-        fig = create_player_type_pie_chart(filtered_df)
-        st.plotly_chart(fig, use_container_width=True)
+        # Advanced stats comparison
+        st.subheader("🔬 Advanced Statistics Comparison")
+        advanced_stats = ['eFG%', 'TS%', 'FTR', 'AST_TOV_Ratio', 'hAST%', 'TOV%', 'Game_Score', 'BPM']
+        fig_advanced = get_chart('advanced_comparison', filter_signature, player_names, tuple(advanced_stats))
+        st.plotly_chart(fig_advanced, use_container_width=True)
         
-        # Player Type Distribution Explanation
-        st.subheader("📋 Player Type Distribution Explanation")
+        # Detailed comparison table
+        st.subheader("📋 Detailed Comparison")
+        
+        comparison_df = get_comparison_table(filter_signature, player_names)
+        st.dataframe(comparison_df.style.format(COMPARISON_FORMATS), use_container_width=True, hide_index=True)
+        
+    else:
+        st.info("Please select at least 2 players to compare.")
+
+@st.fragment
+def render_advanced_stats(filter_signature):
+    """Render the advanced statistics page"""
+    st.header("🔍 Advanced Statistics")
+    
+    # Advanced Statistics Explanation
+    st.subheader("📚 Advanced Statistics Explained")
+    
+    with st.expander("📖 What are Advanced Statistics?", expanded=False):
         st.markdown("""
-        Our player classification system uses rule-based categorization to ensure every player is properly classified:
-            
-        **🎯 Point Guards (PG) & Shooting Guards (SG)**:
-        - **Playmaking Guard**
-        - **Defensive Guard**
-        - **Scoring Guard**
-        
-        **🔥 Small Forwards (SF)**:
-        - **Wing Defender**
-        - **Wing Scorer**
-        - **3&D Player**
-        
-        **🏀 Power Forwards (PF) & Centers (C)**:
-        - **Playmaking Big**
-        - **Rim Protector**
-        - **Glass Cleaner**""", unsafe_allow_html=True)
-    
-    with tab2:
-        st.header("🎯 Top Fantasy Picks")
-        
-        # Create fantasy ranking
-        ranked_df = create_fantasy_ranking(filtered_df, min_games, fantasy_weights)
-        
-        # Display top picks
-        st.subheader("🏆 Top 20 Fantasy Picks")
-        
-        top_20 = ranked_df.head(20)
-        
-        for idx, player in top_20.iterrows():
-            player_summary = get_player_summary(player)
-            with st.expander(f"#{player['Fantasy_Rank']} {player_summary['name']} ({player_summary['team']}) - {player_summary['position']}"):
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.metric("Fantasy Points", format_stat(player_summary['fantasy_points']))
-                    st.metric("Points", format_stat(player_summary['points']))
-                    st.metric("Rebounds", format_stat(player_summary['rebounds']))
-                
-                with col2:
-                    st.metric("Assists", format_stat(player_summary['assists']))
-                    st.metric("Steals", format_stat(player_summary['steals']))
-                    st.metric("Blocks", format_stat(player_summary['blocks']))
-                
-                with col3:
-                    st.metric("FG%", format_percentage(player_summary['fg_percentage']))
-                    st.metric("3P%", format_percentage(player_summary['three_p_percentage']))
-                    st.metric("FT%", format_percentage(player_summary['ft_percentage']))
-                
-                st.write(f"**Player Type:** {player_summary['player_type']}")
-                st.write(f"**Games Played:** {player_summary['games']}")
-                st.write(f"**Minutes per Game:** {format_stat(player_summary['minutes'])}")
-        
-        # Fantasy points vs efficiency scatter plot
-        fig = create_fantasy_vs_efficiency_scatter(ranked_df, 50)
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with tab3:
-        st.header("📈 Player Analysis")
-        
-        # Player search
-        player_search = st.selectbox("Select a player to analyze:", 
-                                   [''] + sorted(filtered_df['Player'].unique().tolist()))
-        
-        if player_search:
-            player_data = filtered_df[filtered_df['Player'] == player_search].iloc[0]
-            player_summary = get_player_summary(player_data)
-            
-            st.subheader(f"📊 {player_search} Analysis")
-            
-            # Basic info section
-            col1, col2 = st.columns([1, 2])
-            
-            with col1:
-                st.metric("Team", player_summary['team'])
-                st.metric("Position", player_summary['position'])
-                st.metric("Age", player_summary['age'])
-                st.metric("Games Played", player_summary['games'])
-                st.metric("Player Type", player_summary['player_type'])
-            
-            with col2:
-                # Performance radar chart
-                fig = create_player_radar_chart(player_data, player_search, filtered_df)
-                st.plotly_chart(fig, use_container_width=True)
-            
-            # Main stats section
-            st.subheader("📊 Main Statistics")
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Fantasy Points", format_stat(player_summary['fantasy_points']))
-                st.metric("Points", format_stat(player_summary['points']))
-                st.metric("Assists", format_stat(player_summary['assists']))
-            
-            with col2:
-                st.metric("FG%", format_percentage(player_summary['fg_percentage']))
-                st.metric("Steals", format_stat(player_summary['steals']))
-                st.metric("3P%", format_percentage(player_summary['three_p_percentage']))
-            
-            with col3:
-                st.metric("Rebounds", format_stat(player_summary['rebounds']))
-                st.metric("Blocks", format_stat(player_summary['blocks']))
-                st.metric("FT%", format_percentage(player_summary['ft_percentage']))
-            
-            with col4:
-                st.metric("Turnovers", format_stat(player_summary['turnovers']))
-                st.metric("Minutes", format_stat(player_summary['minutes']))
-            
-            # Advanced stats section
-            st.subheader("🔬 Advanced Statistics")
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("eFG%", format_percentage(player_summary['efg_percentage']))
-                st.metric("TS%", format_percentage(player_summary['ts_percentage']))
-                st.metric("FTR", format_stat(player_summary['ftr'], 3))
-            
-            with col2:
-                st.metric("AST/TOV Ratio", format_stat(player_summary['ast_tov_ratio'], 2))
-                st.metric("hAST%", format_percentage(player_summary['hast_percentage']))
-            
-            with col3:
-                st.metric("TOV%", format_percentage(player_summary['tov_percentage']))
-                try:
-                    st.metric("Game Score", format_stat(player_summary['game_score']))
-                    st.metric("BPM", format_stat(player_summary['bpm']))
-                except KeyError as e:
-                    st.error(f"Error loading advanced stats: {e}")
-                    st.info("Please refresh the page to load the latest data.")
-            
-            # Similar players
-            st.subheader("🔍 Similar Players")
-            similar_players = get_similar_players(filtered_df, player_search, player_data['Player_Type'], 5)
-            
-            for idx, similar in similar_players.iterrows():
-                st.write(f"• **{similar['Player']}** ({similar['Team']}) - {format_stat(similar['Fantasy_Points'])} fantasy points")
-    
-    with tab4:
-        st.header("⚖️ Player Comparison")
-        
-        # Player selection for comparison
-        st.subheader("Select Players to Compare (Up to 5)")
-        
-        # Get list of players for selection
-        player_list = sorted(filtered_df['Player'].unique().tolist())
-        
-        # Create columns for player selection
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        selected_players = []
+        **Advanced statistics** provide deeper insights into player performance beyond traditional box score stats. 
+        They help evaluate efficiency, usage, and overall impact on the game.
+        
+        ### 🎯 **Key Advanced Metrics:**
+        
+        **📊 Effective Field Goal Percentage (eFG%)**
+        - **Formula:** (FG + 0.5 × 3P) / FGA
+        - **What it measures:** Shooting efficiency accounting for the extra value of 3-pointers
+        - **Why it matters:** A 40% 3-point shooter is as efficient as a 60% 2-point shooter
+        
+        **🎯 True Shooting Percentage (TS%)**
+        - **Formula:** PTS / (2 × (FGA + 0.475 × FTA))
+        - **What it measures:** Overall scoring efficiency including free throws
+        - **Why it matters:** Shows how efficiently a player scores considering all shot types
+        
+        **🏀 Free Throw Rate (FTR)**
+        - **Formula:** FT / FGA
+        - **What it measures:** How often a player gets to the free throw line relative to field goal attempts
+        - **Why it matters:** Indicates aggressiveness and ability to draw fouls
+        
+        **⚖️ Assist to Turnover Ratio (AST/TOV)**
+        - **Formula:** AST / TOV
+        - **What it measures:** Ball security and playmaking efficiency
+        - **Why it matters:** Higher ratios indicate better decision-making and ball control
+        
+        **🎮 Hollinger Assist Ratio (hAST%)**
+        - **Formula:** AST / (FGA + 0.475 × FTA + AST + TOV)
+        - **What it measures:** Percentage of possessions that end in an assist
+        - **Why it matters:** Shows how often a player creates scoring opportunities for teammates
+        
+        **🔄 Turnover Percentage (TOV%)**
+        - **Formula:** TOV / (FGA + 0.475 × FTA + AST + TOV)
+        - **What it measures:** Percentage of possessions that end in a turnover
+        - **Why it matters:** Lower percentages indicate better ball security and decision-making
+        
+        **🎮 Game Score**
+        - **Formula:** PTS + 0.4×FG – 0.7×FGA – 0.4×(FTA – FT) + 0.7×ORB + 0.3×DRB + STL + 0.7×AST + 0.7×BLK – 0.4×PF – TOV
+        - **What it measures:** Overall game impact using box score statistics
+        - **Why it matters:** Higher game scores indicate more impactful individual performances
+        
+        **📊 Box Plus Minus (BPM)**
+        - **Formula:** Position-adjusted calculation using interpolation table coefficients
+        - **What it measures:** Player's contribution per 100 possessions relative to league average
+        - **Why it matters:** Accounts for position-specific roles and provides context-adjusted performance metrics
+        """)
+    
+    # Advanced Statistics Charts
+    st.subheader("📈 Advanced Statistics Analysis")
+    
+    # Chart selection
+    chart_type = st.selectbox("Select Chart Type", [
+        "Distribution Analysis",
+        "Scatter Plot Analysis", 
+        "Position Analysis",
+        "Team Analysis"
+    ])
+    
+    if chart_type == "Distribution Analysis":
+        st.subheader("📊 Distribution of Advanced Statistics")
+        
+        col1, col2 = st.columns(2)
+        
         with col1:
-            player1 = st.selectbox("Player 1", [''] + player_list, key="player1")
-            if player1:
-                selected_players.append(player1)
+            stat_choice1 = st.selectbox("Select Statistic 1", 
+                ['eFG%', 'TS%', 'FTR', 'AST_TOV_Ratio', 'hAST%', 'TOV%', 'Game_Score', 'BPM'], key="dist1")
+            if stat_choice1:
+                fig1 = get_chart('advanced_distribution', filter_signature, stat_choice1)
+                st.plotly_chart(fig1, use_container_width=True)
         
         with col2:
-            player2 = st.selectbox("Player 2", [''] + player_list, key="player2")
-            if player2:
-                selected_players.append(player2)
-        
-        with col3:
-            player3 = st.selectbox("Player 3", [''] + player_list, key="player3")
-            if player3:
-                selected_players.append(player3)
-        
-        with col4:
-            player4 = st.selectbox("Player 4", [''] + player_list, key="player4")
-            if player4:
-                selected_players.append(player4)
-        
-        with col5:
-            player5 = st.selectbox("Player 5", [''] + player_list, key="player5")
-            if player5:
-                selected_players.append(player5)
-        
-        if len(selected_players) >= 2:
-            # Get player data
-            players_data = []
-            player_names = []
-            
-            for player_name in selected_players:
-                player_data = filtered_df[filtered_df['Player'] == player_name].iloc[0]
-                players_data.append(player_data)
-                player_names.append(player_name)
-            
-            # Display comparison
-            st.subheader("📊 Player Comparison")
-            
-            # Radar chart comparison
-            fig_radar = create_multi_player_radar_chart(players_data, player_names, filtered_df)
-            st.plotly_chart(fig_radar, use_container_width=True)
-            
-            # Advanced stats comparison
-            st.subheader("🔬 Advanced Statistics Comparison")
-            advanced_stats = ['eFG%', 'TS%', 'FTR', 'AST_TOV_Ratio', 'hAST%', 'TOV%', 'Game_Score', 'BPM']
-            fig_advanced = create_advanced_stats_comparison_chart(players_data, player_names, advanced_stats)
-            st.plotly_chart(fig_advanced, use_container_width=True)
-            
-            # Detailed comparison table
-            st.subheader("📋 Detailed Comparison")
-            
-            comparison_data = []
-            for i, (player_data, player_name) in enumerate(zip(players_data, player_names)):
-                player_summary = get_player_summary(player_data)
-                comparison_data.append({
-                    'Player': player_name,
-                    'Team': player_summary['team'],
-                    'Position': player_summary['position'],
-                    'Fantasy Points': format_stat(player_summary['fantasy_points']),
-                    'Points': format_stat(player_summary['points']),
-                    'Rebounds': format_stat(player_summary['rebounds']),
-                    'Assists': format_stat(player_summary['assists']),
-                    'Steals': format_stat(player_summary['steals']),
-                    'Blocks': format_stat(player_summary['blocks']),
-                    'FG%': format_percentage(player_summary['fg_percentage']),
-                    '3P%': format_percentage(player_summary['three_p_percentage']),
-                    'FT%': format_percentage(player_summary['ft_percentage']),
-                    'eFG%': format_percentage(player_summary['efg_percentage']),
-                    'TS%': format_percentage(player_summary['ts_percentage']),
-                    'AST/TOV': format_stat(player_summary['ast_tov_ratio'], 2),
-                    'hAST%': format_percentage(player_summary['hast_percentage']),
-                    'TOV%': format_percentage(player_summary['tov_percentage']),
-                    'Game Score': format_stat(player_summary['game_score']),
-                    'BPM': format_stat(player_summary['bpm'])
-                })
-            
-            comparison_df = pd.DataFrame(comparison_data)
-            st.dataframe(comparison_df, use_container_width=True)
-            
-        else:
-            st.info("Please select at least 2 players to compare.")
-    
-    with tab5:
-        st.header("🔍 Advanced Statistics")
-        
-        # Advanced Statistics Explanation
-        st.subheader("📚 Advanced Statistics Explained")
-        
-        with st.expander("📖 What are Advanced Statistics?", expanded=False):
-            st.markdown("""
-            **Advanced statistics** provide deeper insights into player performance beyond traditional box score stats. 
-            They help evaluate efficiency, usage, and overall impact on the game.
-            
-            ### 🎯 **Key Advanced Metrics:**
-            
-            **📊 Effective Field Goal Percentage (eFG%)**
-            - **Formula:** (FG + 0.5 × 3P) / FGA
-            - **What it measures:** Shooting efficiency accounting for the extra value of 3-pointers
-            - **Why it matters:** A 40% 3-point shooter is as efficient as a 60% 2-point shooter
-            
-            **🎯 True Shooting Percentage (TS%)**
-            - **Formula:** PTS / (2 × (FGA + 0.475 × FTA))
-            - **What it measures:** Overall scoring efficiency including free throws
-            - **Why it matters:** Shows how efficiently a player scores considering all shot types
-            
-            **🏀 Free Throw Rate (FTR)**
-            - **Formula:** FT / FGA
-            - **What it measures:** How often a player gets to the free throw line relative to field goal attempts
-            - **Why it matters:** Indicates aggressiveness and ability to draw fouls
-            
-            **⚖️ Assist to Turnover Ratio (AST/TOV)**
-            - **Formula:** AST / TOV
-            - **What it measures:** Ball security and playmaking efficiency
-            - **Why it matters:** Higher ratios indicate better decision-making and ball control
-            
-            **🎮 Hollinger Assist Ratio (hAST%)**
-            - **Formula:** AST / (FGA + 0.475 × FTA + AST + TOV)
-            - **What it measures:** Percentage of possessions that end in an assist
-            - **Why it matters:** Shows how often a player creates scoring opportunities for teammates
-            
-            **🔄 Turnover Percentage (TOV%)**
-            - **Formula:** TOV / (FGA + 0.475 × FTA + AST + TOV)
-            - **What it measures:** Percentage of possessions that end in a turnover
-            - **Why it matters:** Lower percentages indicate better ball security and decision-making
-            
-            **🎮 Game Score**
-            - **Formula:** PTS + 0.4×FG – 0.7×FGA – 0.4×(FTA – FT) + 0.7×ORB + 0.3×DRB + STL + 0.7×AST + 0.7×BLK – 0.4×PF – TOV
-            - **What it measures:** Overall game impact using box score statistics
-            - **Why it matters:** Higher game scores indicate more impactful individual performances
-            
-            **📊 Box Plus Minus (BPM)**
-            - **Formula:** Position-adjusted calculation using interpolation table coefficients
-            - **What it measures:** Player's contribution per 100 possessions relative to league average
-            - **Why it matters:** Accounts for position-specific roles and provides context-adjusted performance metrics
-            """)
-        
-        # Advanced Statistics Charts
-        st.subheader("📈 Advanced Statistics Analysis")
-        
-        # Chart selection
-        chart_type = st.selectbox("Select Chart Type", [
-            "Distribution Analysis",
-            "Scatter Plot Analysis", 
-            "Position Analysis",
-            "Team Analysis"
-        ])
-        
-        if chart_type == "Distribution Analysis":
-            st.subheader("📊 Distribution of Advanced Statistics")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                stat_choice1 = st.selectbox("Select Statistic 1", 
-                    ['eFG%', 'TS%', 'FTR', 'AST_TOV_Ratio', 'hAST%', 'TOV%', 'Game_Score', 'BPM'], key="dist1")
-                if stat_choice1:
-                    fig1 = create_advanced_stats_distribution_chart(filtered_df, stat_choice1)
-                    st.plotly_chart(fig1, use_container_width=True)
-            
-            with col2:
-                stat_choice2 = st.selectbox("Select Statistic 2", 
-                    ['eFG%', 'TS%', 'FTR', 'AST_TOV_Ratio', 'hAST%', 'TOV%', 'Game_Score', 'BPM'], key="dist2")
-                if stat_choice2 and stat_choice2 != stat_choice1:
-                    fig2 = create_advanced_stats_distribution_chart(filtered_df, stat_choice2)
-                    st.plotly_chart(fig2, use_container_width=True)
-        
-        elif chart_type == "Scatter Plot Analysis":
-            st.subheader("🔍 Advanced Statistics Correlations")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                x_stat = st.selectbox("X-Axis Statistic", 
-                    ['eFG%', 'TS%', 'FTR', 'AST_TOV_Ratio', 'hAST%', 'TOV%', 'Game_Score', 'BPM'], key="scatter_x")
-            
-            with col2:
-                y_stat = st.selectbox("Y-Axis Statistic", 
-                    ['eFG%', 'TS%', 'FTR', 'AST_TOV_Ratio', 'hAST%', 'TOV%', 'Game_Score', 'BPM'], key="scatter_y")
-            
-            if x_stat and y_stat and x_stat != y_stat:
-                fig = create_advanced_stats_scatter(filtered_df, x_stat, y_stat)
-                st.plotly_chart(fig, use_container_width=True)
-        
-        elif chart_type == "Position Analysis":
-            st.subheader("🏀 Position-Based Advanced Statistics")
-            
-            # Position analysis
-            position_stats = get_position_stats(filtered_df)
-            fig = create_position_analysis_chart(position_stats)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        elif chart_type == "Team Analysis":
-            st.subheader("🏆 Team Advanced Statistics")
-            
-            # Team analysis
-            team_stats = get_team_stats(filtered_df)
-            fig = create_team_analysis_chart(team_stats, 'avg', 15)
-            st.plotly_chart(fig, use_container_width=True)
+            stat_choice2 = st.selectbox("Select Statistic 2", 
+                ['eFG%', 'TS%', 'FTR', 'AST_TOV_Ratio', 'hAST%', 'TOV%', 'Game_Score', 'BPM'], key="dist2")
+            if stat_choice2 and stat_choice2 != stat_choice1:
+                fig2 = get_chart('advanced_distribution', filter_signature, stat_choice2)
+                st.plotly_chart(fig2, use_container_width=True)
     
-    with tab6:
-        st.header("🤖 AI Assistant")
-        st.write("Ask me anything about NBA players, stats, or fantasy recommendations!")
-        
-        # Initialize chatbot with full dataset for accurate top player recommendations
-        if 'chatbot' not in st.session_state:
-            st.session_state.chatbot = NBAFantasyChatbot(df)
-        
-        # Chat interface
-        user_input = st.text_input("Ask me anything:", placeholder="e.g., 'Tell me about LeBron James' or 'Top fantasy players'")
-        
-        if st.button("Ask") or user_input:
-            if user_input:
-                with st.spinner("Thinking..."):
-                    response = st.session_state.chatbot.process_query(user_input)
-                st.markdown(response)
-        
-        
-        # Example queries
-        st.subheader("💡 Example Queries")
-        st.write("Try asking me:")
-        
-        example_queries = [
-            "Tell me about Nikola Jokic",
-            "Top fantasy players",
-            "Best point guards",
-            "Compare LeBron James vs Stephen Curry",
-            "Fantasy sleepers",
-            "Lakers players",
-            "Who should I draft first?",
-            "League averages",
-            "Game score leaders",
-            "Draft strategy",
-            "Overvalued players",
-            "Waiver wire targets"
-        ]
-        
-        for query in example_queries:
-            if st.button(f"💬 {query}", key=f"example_{query}"):
-                with st.spinner("Thinking..."):
-                    response = st.session_state.chatbot.process_query(query)
-                st.markdown(response)
-    
-    with tab7:
-        st.header("👨‍💻 About the Author")
-        
-        # Author information
-        col1, col2 = st.columns([1, 2])
+    elif chart_type == "Scatter Plot Analysis":
+        st.subheader("🔍 Advanced Statistics Correlations")
+        
+        col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("""
-            <div style="text-align: center;">
-                <h2>🏀</h2>
-                <h3>Ezra Dese</h3>
-            </div>
-            """, unsafe_allow_html=True)
+            x_stat = st.selectbox("X-Axis Statistic", 
+                ['eFG%', 'TS%', 'FTR', 'AST_TOV_Ratio', 'hAST%', 'TOV%', 'Game_Score', 'BPM'], key="scatter_x")
         
         with col2:
-            st.markdown("""
-            ### 🎯 **The Story Behind This Dashboard**
-            
-            Hi there! I'm **Ezra Dese**, an engineer who got bored and NEEDS to start **winning fantasy basketball**! 🏀
-            
-            ### 🔧 **Background**
-            - **Mechanical Engineer** by training
-            - **Fantasy Basketball Addict** by choice
-            - **Python Developer** by necessity (to build this dashboard!)
-            
-            ### 🎯 **Why This Dashboard?**
-            After countless hours of manually analyzing player stats and trying to predict the best fantasy picks, I realized there had to be a better way. So I combined my engineering problem-solving skills with my love for basketball to create this comprehensive NBA Fantasy Dashboard.
-            
-            ### 🚀 **What You Get**
-            - **AI-Powered Recommendations** - Smart player analysis and rankings
-            - **Advanced Statistics** - Deep dive into player performance metrics
-            - **Interactive Visualizations** - Beautiful charts and graphs
-            - **Real-Time Data** - Always up-to-date with the latest NBA stats
-            
-            ### 🔗 **Connect With Me**
-            """, unsafe_allow_html=True)
-            
-            # Social links
-            col_linkedin, col_github = st.columns(2)
-            
-            with col_linkedin:
-                st.markdown("""
-                <div style="text-align: center; padding: 10px; border: 2px solid #0077b5; border-radius: 10px; background-color: #f0f8ff;">
-                    <h4>💼 LinkedIn</h4>
-                    <p><strong>Ezra Dese</strong></p>
-                    <p>Connect with me for professional networking and data science discussions!</p>
-                    <a href="https://www.linkedin.com/in/ezra-dese/" target="_blank" style="color: #0077b5; text-decoration: none; font-weight: bold;">🔗 Connect on LinkedIn</a>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col_github:
-                st.markdown("""
-                <div style="text-align: center; padding: 10px; border: 2px solid #333; border-radius: 10px; background-color: #f8f8f8;">
-                    <h4>🐙 GitHub</h4>
-                    <p><strong>ezra-dese</strong></p>
-                    <p>Check out my other projects and contribute to open source!</p>
-                    <a href="https://github.com/ezra-dese" target="_blank" style="color: #333; text-decoration: none; font-weight: bold;">🔗 View GitHub Profile</a>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        # Technical details
-        st.markdown("---")
-        st.subheader("🛠️ **Technical Details**")
-        
-        col_tech1, col_tech2 = st.columns(2)
-        
-        with col_tech1:
-            st.markdown("""
-            **Built With:**
-            - 🐍 **Python** - Core programming language
-            - 📊 **Streamlit** - Web application framework
-            - 📈 **Plotly** - Interactive visualizations
-            - 🐼 **Pandas** - Data manipulation and analysis
-            - 🤖 **Scikit-learn** - Machine learning for player clustering
-            - 📊 **Excel** - Data source (2024 NBA Player Statistics)
-            """)
-        
-        with col_tech2:
-            st.markdown("""
-            **Features:**
-            - ✅ **Duplicate Player Handling** - Clean, accurate data
-            - ✅ **AI Chatbot** - Interactive player queries
-            - ✅ **Fantasy Rankings** - Smart player recommendations
-            - ✅ **Advanced Analytics** - Statistical analysis and correlations
-            - ✅ **Responsive Design** - Works on all devices
-            - ✅ **Real-Time Updates** - Auto-deploys from GitHub
-            """)
-        
-        # Fun facts
-        st.markdown("---")
-        st.subheader("🎯 **Fun Facts**")
+            y_stat = st.selectbox("Y-Axis Statistic", 
+                ['eFG%', 'TS%', 'FTR', 'AST_TOV_Ratio', 'hAST%', 'TOV%', 'Game_Score', 'BPM'], key="scatter_y")
         
-        st.markdown("""
-        - 🏀 **Favorite NBA Team**: SACTOWN BABYYYYY!
-        - 📊 **Data Points Analyzed**: Over 15,000 individual player statistics
-        - 🤖 **AI Responses**: The chatbot can answer 50+ different types of queries
-        - 💻 **Built With**: Python, Streamlit, Plotly, Pandas, Scikit-learn, Excel
-        - 📈 **Guranteed to Dominate**: NBA Fantasy 100% of the time
-        """)
+        if x_stat and y_stat and x_stat != y_stat:
+            fig = get_chart('advanced_scatter', filter_signature, x_stat, y_stat)
+            st.plotly_chart(fig, use_container_width=True)
+    
+    elif chart_type == "Position Analysis":
+        st.subheader("🏀 Position-Based Advanced Statistics")
         
-        # Call to action
-        st.markdown("---")
-        st.markdown("""
-        <div style="text-align: center; padding: 20px; background-color: #f0f2f6; border-radius: 10px;">
-            <h3>🎯 Ready to Dominate Your Fantasy League?</h3>
-            <p>Use this dashboard to make data-driven decisions and leave your competition in the dust!</p>
-            <p><strong>Good luck, and may the fantasy gods be with you! 🏀</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
+        # Position analysis
+        fig = get_chart('position_analysis', filter_signature)
+        st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
+    
+    elif chart_type == "Team Analysis":
+        st.subheader("🏆 Team Advanced Statistics")
+        
+        # Team analysis
+        fig = get_chart('team_analysis', filter_signature, 'avg', 15)
+        st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
+
+def set_ai_query(query=None):
+    """Callback storing the AI assistant query, from an example or the text input"""
+    st.session_state.ai_query = query if query is not None else st.session_state.get('ai_input', '')
+
+@st.fragment
+def render_ai_assistant(filter_signature):
+    """Render the AI assistant page"""
+    st.header("🤖 AI Assistant")
+    st.write("Ask me anything about NBA players, stats, or fantasy recommendations!")
+    
+    st.caption("Answers cover the players matching the sidebar filters.")
+    
+    # Chat interface
+    st.text_input("Ask me anything:", placeholder="e.g., 'Tell me about LeBron James' or 'Top fantasy players'",
+                  key="ai_input", on_change=set_ai_query)
+    st.button("Ask", on_click=set_ai_query)
+    
+    # Every input funnels into one query, answered once per query and filter
+    # state rather than again on each rerun
+    # Collapse whitespace so trivially different inputs share a cached answer
+    query = ' '.join(st.session_state.get('ai_query', '').split())
+    if query:
+        if st.session_state.get('ai_last_query') != (query, filter_signature):
+            with st.spinner("Thinking..."):
+                st.session_state.ai_last_response = get_ai_response(filter_signature, query)
+            st.session_state.ai_last_query = (query, filter_signature)
+        st.markdown(st.session_state.ai_last_response)
+    
+    
+    # Example queries
+    st.subheader("💡 Example Queries")
+    st.write("Try asking me:")
+    
+    example_queries = [
+        "Tell me about Nikola Jokic",
+        "Top fantasy players",
+        "Best point guards",
+        "Compare LeBron James vs Stephen Curry",
+        "Fantasy sleepers",
+        "Lakers players",
+        "Who should I draft first?",
+        "League averages",
+        "Game score leaders",
+        "Draft strategy",
+        "Overvalued players",
+        "Waiver wire targets"
+    ]
+    
+    for example in example_queries:
+        st.button(f"💬 {example}", key=f"example_{example}", on_click=set_ai_query, args=(example,))
+
+# About the Author page content
+AUTHOR_BADGE_HTML = """
+<div style="text-align: center;">
+    <h2>🏀</h2>
+    <h3>Ezra Dese</h3>
+</div>
+"""
+
+AUTHOR_STORY = """
+### 🎯 **The Story Behind This Dashboard**
+
+Hi there! I'm **Ezra Dese**, an engineer who got bored and NEEDS to start **winning fantasy basketball**! 🏀
+
+### 🔧 **Background**
+- **Mechanical Engineer** by training
+- **Fantasy Basketball Addict** by choice
+- **Python Developer** by necessity (to build this dashboard!)
+
+### 🎯 **Why This Dashboard?**
+After countless hours of manually analyzing player stats and trying to predict the best fantasy picks, I realized there had to be a better way. So I combined my engineering problem-solving skills with my love for basketball to create this comprehensive NBA Fantasy Dashboard.
+
+### 🚀 **What You Get**
+- **AI-Powered Recommendations** - Smart player analysis and rankings
+- **Advanced Statistics** - Deep dive into player performance metrics
+- **Interactive Visualizations** - Beautiful charts and graphs
+- **Real-Time Data** - Always up-to-date with the latest NBA stats
+
+### 🔗 **Connect With Me**
+"""
+
+LINKEDIN_CARD_HTML = """
+<div style="text-align: center; padding: 10px; border: 2px solid #0077b5; border-radius: 10px; background-color: #f0f8ff;">
+    <h4>💼 LinkedIn</h4>
+    <p><strong>Ezra Dese</strong></p>
+    <p>Connect with me for professional networking and data science discussions!</p>
+    <a href="https://www.linkedin.com/in/ezra-dese/" target="_blank" style="color: #0077b5; text-decoration: none; font-weight: bold;">🔗 Connect on LinkedIn</a>
+</div>
+"""
+
+GITHUB_CARD_HTML = """
+<div style="text-align: center; padding: 10px; border: 2px solid #333; border-radius: 10px; background-color: #f8f8f8;">
+    <h4>🐙 GitHub</h4>
+    <p><strong>ezra-dese</strong></p>
+    <p>Check out my other projects and contribute to open source!</p>
+    <a href="https://github.com/ezra-dese" target="_blank" style="color: #333; text-decoration: none; font-weight: bold;">🔗 View GitHub Profile</a>
+</div>
+"""
+
+BUILT_WITH = """
+**Built With:**
+- 🐍 **Python** - Core programming language
+- 📊 **Streamlit** - Web application framework
+- 📈 **Plotly** - Interactive visualizations
+- 🐼 **Pandas** - Data manipulation and analysis
+- 🔢 **NumPy** - Vectorized stat calculations
+- 📊 **Excel** - Data source (2024 NBA Player Statistics)
+"""
+
+FEATURES = """
+**Features:**
+- ✅ **Duplicate Player Handling** - Clean, accurate data
+- ✅ **AI Chatbot** - Interactive player queries
+- ✅ **Fantasy Rankings** - Smart player recommendations
+- ✅ **Advanced Analytics** - Statistical analysis and correlations
+- ✅ **Responsive Design** - Works on all devices
+- ✅ **Real-Time Updates** - Auto-deploys from GitHub
+"""
+
+FUN_FACTS = """
+- 🏀 **Favorite NBA Team**: SACTOWN BABYYYYY!
+- 📊 **Data Points Analyzed**: Over 15,000 individual player statistics
+- 🤖 **AI Responses**: The chatbot can answer 50+ different types of queries
+- 💻 **Built With**: Python, Streamlit, Plotly, Pandas, NumPy, Excel
+- 📈 **Guranteed to Dominate**: NBA Fantasy 100% of the time
+"""
+
+CALL_TO_ACTION_HTML = """
+<div style="text-align: center; padding: 20px; background-color: #f0f2f6; border-radius: 10px;">
+    <h3>🎯 Ready to Dominate Your Fantasy League?</h3>
+    <p>Use this dashboard to make data-driven decisions and leave your competition in the dust!</p>
+    <p><strong>Good luck, and may the fantasy gods be with you! 🏀</strong></p>
+</div>
+"""
+
+def render_about():
+    """Render the about the author page"""
+    st.header("👨‍💻 About the Author")
+    
+    # Author information
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.markdown(AUTHOR_BADGE_HTML, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(AUTHOR_STORY, unsafe_allow_html=True)
+        
+        # Social links
+        col_linkedin, col_github = st.columns(2)
+        
+        with col_linkedin:
+            st.markdown(LINKEDIN_CARD_HTML, unsafe_allow_html=True)
+        
+        with col_github:
+            st.markdown(GITHUB_CARD_HTML, unsafe_allow_html=True)
+    
+    # Technical details
+    st.markdown("---")
+    st.subheader("🛠️ **Technical Details**")
+    
+    col_tech1, col_tech2 = st.columns(2)
+    
+    with col_tech1:
+        st.markdown(BUILT_WITH)
+    
+    with col_tech2:
+        st.markdown(FEATURES)
+    
+    # Fun facts
+    st.markdown("---")
+    st.subheader("🎯 **Fun Facts**")
+    
+    st.markdown(FUN_FACTS)
+    
+    # Call to action
+    st.markdown("---")
+    st.markdown(CALL_TO_ACTION_HTML, unsafe_allow_html=True)
+
+
+def main():
+    # Header
+    st.markdown('<h1 class="main-header">🏀 NBA Fantasy League Dashboard</h1>', unsafe_allow_html=True)
+    
+    # Load data
+    df = get_cached_data()
+    
+    if df.empty:
+        st.error("Failed to load data. Please check if the Excel file exists.")
+        return
+    
+    # Get filter options
+    try:
+        filter_options = get_cached_filter_options()
+    except Exception as e:
+        st.error(f"Error getting filter options: {e}")
+        return
+    
+    # Sidebar filters - batched in a form so adjusting several controls
+    # triggers a single rerun when they are applied
+    with st.sidebar.form("filters"):
+        st.header("🔍 Filters")
+        
+        # Position filter
+        selected_pos = st.selectbox("Position", filter_options['positions'])
+        
+        # Team filter
+        selected_team = st.selectbox("Team", filter_options['teams'])
+        
+        # Age range
+        age_range = st.slider("Age Range", 
+                              filter_options['age_range'][0], 
+                              filter_options['age_range'][1], 
+                              filter_options['age_range'])
+        
+        # Minimum games played
+        min_games = st.slider("Minimum Games Played", 
+                              filter_options['games_range'][0], 
+                              filter_options['games_range'][1], 
+                              20)
+        
+        # Points per game range - with error handling
+        try:
+            ppg_range = st.slider("Points Per Game Range", 
+                                  filter_options['ppg_range'][0], 
+                                  filter_options['ppg_range'][1], 
+                                  filter_options['ppg_range'])
+        except KeyError:
+            # Fallback if ppg_range is not available
+            ppg_min, ppg_max = 0.0, 50.0
+            if 'PTS' in df.columns:
+                ppg_min, ppg_max = 0.0, float(df['PTS'].max())
+            ppg_range = st.slider("Points Per Game Range", 
+                                  ppg_min, ppg_max, (ppg_min, ppg_max))
+        
+        # Fantasy scoring weights customization
+        st.header("⚙️ Fantasy Scoring Weights")
+        st.write("Customize how much each stat is worth in fantasy points:")
+        
+        pts_weight = st.number_input("Points Weight", min_value=0.0, max_value=5.0, value=1.0, step=0.1)
+        reb_weight = st.number_input("Rebounds Weight", min_value=0.0, max_value=5.0, value=1.25, step=0.1)
+        ast_weight = st.number_input("Assists Weight", min_value=0.0, max_value=5.0, value=1.5, step=0.1)
+        stl_weight = st.number_input("Steals Weight", min_value=0.0, max_value=5.0, value=2.0, step=0.1)
+        blk_weight = st.number_input("Blocks Weight", min_value=0.0, max_value=5.0, value=2.0, step=0.1)
+        tov_weight = st.number_input("Turnovers Weight (negative)", min_value=-5.0, max_value=0.0, value=-1.0, step=0.1)
+        
+        st.form_submit_button("Apply", use_container_width=True)
+    
+    # Display current formula
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("**Current Formula:**")
+    st.sidebar.markdown(f"PTS({pts_weight}) + TRB({reb_weight}) + AST({ast_weight}) + STL({stl_weight}) + BLK({blk_weight}) + TOV({tov_weight})")
+    
+    # Store weights in session state
+    fantasy_weights = {
+        'PTS': pts_weight,
+        'TRB': reb_weight,
+        'AST': ast_weight,
+        'STL': stl_weight,
+        'BLK': blk_weight,
+        'TOV': tov_weight
+    }
+    st.session_state.fantasy_weights = fantasy_weights
+    
+    # Validate filters once at the boundary; everything downstream works
+    # from the cache key built out of the validated FilterSpec. Reruns that
+    # leave the filters unchanged reuse this session's spec
+    filter_inputs = (selected_pos, selected_team, age_range, min_games, ppg_range)
+    if st.session_state.get('filter_inputs') == filter_inputs:
+        filter_spec = st.session_state.filter_spec
+    else:
+        try:
+            filter_spec = FilterSpec.from_inputs(*filter_inputs)
+        except ValueError:
+            st.error("Invalid filter settings. Please check your selections.")
+            return
+        st.session_state.filter_inputs = filter_inputs
+        st.session_state.filter_spec = filter_spec
+    
+    filter_signature = get_filter_signature(filter_spec, fantasy_weights)
+    
+    # Main content - a tab-like horizontal radio; unlike st.tabs, only the
+    # selected view is built on each rerun
+    st.radio("View", VIEWS, horizontal=True, key="active_tab", label_visibility="collapsed")
+    view = st.session_state.active_tab
+    
+    if view == "📊 Overview":
+        render_overview(filter_signature)
+    elif view == "🎯 Top Picks":
+        render_top_picks(filter_signature)
+    elif view == "📈 Player Analysis":
+        render_player_analysis(filter_signature)
+    elif view == "⚖️ Player Comparison":
+        render_player_comparison(filter_signature)
+    elif view == "🔍 Advanced Stats":
+        render_advanced_stats(filter_signature)
+    elif view == "🤖 AI Assistant":
+        render_ai_assistant(filter_signature)
+    elif view == "👨‍💻 About the Author":
+        render_about()
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style='text-align: center; color: #666;'>
-        <p>🏀 NBA Fantasy League Dashboard | Built with Streamlit & Plotly</p>
-        <p>Data: 2024 NBA Player Statistics | Fantasy scoring: Customizable weights in sidebar</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,30 @@
+"""
+Convert the dashboard's Excel data files to Parquet
+Run from the repository root after replacing any of the .xlsx files
+"""
+
+import os
+import sys
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_processing import SOURCE_HASH_KEY, file_sha256
+
+DATA_FILES = ['2024NBAplayerStats.xlsx', 'Interpolation table values.xlsx']
+
+def convert(excel_path):
+    """Write a zstd-compressed Parquet copy next to an Excel file, tagged with its hash"""
+    parquet_path = os.path.splitext(excel_path)[0] + '.parquet'
+    table = pa.Table.from_pandas(pd.read_excel(excel_path))
+    metadata = {**(table.schema.metadata or {}), SOURCE_HASH_KEY: file_sha256(excel_path).encode()}
+    pq.write_table(table.replace_schema_metadata(metadata), parquet_path, compression='zstd')
+    return parquet_path
+
+def main(paths):
+    for excel_path in paths or DATA_FILES:
+        print(f"{excel_path} -> {convert(excel_path)}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
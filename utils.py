@@ -5,74 +5,120 @@ Helper functions and calculations
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, Optional
+
+# Standard scoring weights, and the matching weights for PER
+FANTASY_STATS = ('PTS', 'TRB', 'AST', 'STL', 'BLK', 'TOV')
+FANTASY_WEIGHTS = MappingProxyType({'PTS': 1.0, 'TRB': 1.25, 'AST': 1.5, 'STL': 2.0, 'BLK': 2.0, 'TOV': -1.0})
+PER_WEIGHTS = MappingProxyType({'PTS': 1.0, 'TRB': 1.0, 'AST': 1.0, 'STL': 1.0, 'BLK': 1.0, 'TOV': -1.0})
+
+# The formulas below take either a single player's row or a whole DataFrame,
+# so the row-wise and DataFrame-level versions share one definition each
+
+def _weighted_stat_sum(stats, weights: Mapping[str, float]):
+    """Weighted sum of the counting stats, for fantasy points and PER"""
+    total = 0.0
+    for stat in FANTASY_STATS:
+        total = total + stats[stat] * weights[stat]
+    return total
+
+def _usage_rate(stats):
+    """Usage rate, zero for players without minutes"""
+    possessions = stats['FGA'] + stats['FTA'] * 0.44 + stats['AST']
+    if np.ndim(stats['MP']) == 0:
+        return 0.0 if stats['MP'] == 0 else possessions / stats['MP'] * 100
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(stats['MP'] == 0, 0.0, possessions / stats['MP'] * 100)
+
+def _weighted_fantasy_score(stats, fantasy_points, per, usage_rate):
+    """Weighted fantasy score from the other three metrics and shooting"""
+    shooting_avg = (stats['FG%'] + stats['3P%'] + stats['FT%']) / 3
+    return fantasy_points * 0.4 + per * 0.3 + usage_rate * 0.2 + shooting_avg * 0.1
 
 def calculate_fantasy_points(row: pd.Series) -> float:
     """Calculate fantasy points for a single player"""
-    return (
-        row['PTS'] * 1 +           # Points
-        row['TRB'] * 1.2 +         # Rebounds
-        row['AST'] * 1.5 +         # Assists
-        row['STL'] * 2 +           # Steals
-        row['BLK'] * 2 +           # Blocks
-        row['TOV'] * -1            # Turnovers (negative)
-    )
+    return _weighted_stat_sum(row, FANTASY_WEIGHTS)
 
 def calculate_per(row: pd.Series) -> float:
     """Calculate Player Efficiency Rating"""
-    return row['PTS'] + row['TRB'] + row['AST'] + row['STL'] + row['BLK'] - row['TOV']
+    return _weighted_stat_sum(row, PER_WEIGHTS)
 
 def calculate_usage_rate(row: pd.Series) -> float:
     """Calculate usage rate"""
-    if row['MP'] == 0:
-        return 0
-    return (row['FGA'] + row['FTA'] * 0.44 + row['AST']) / row['MP'] * 100
+    return _usage_rate(row)
 
 def calculate_weighted_fantasy_score(row: pd.Series) -> float:
     """Calculate weighted fantasy score considering multiple factors"""
-    shooting_avg = (row['FG%'] + row['3P%'] + row['FT%']) / 3
-    return (
-        row['Fantasy_Points'] * 0.4 +
-        row['PER'] * 0.3 +
-        row['Usage_Rate'] * 0.2 +
-        shooting_avg * 0.1
-    )
+    return _weighted_fantasy_score(row, row['Fantasy_Points'], row['PER'], row['Usage_Rate'])
+
+def calculate_fantasy_points_vec(df: pd.DataFrame, weights: Optional[Mapping[str, float]] = None) -> pd.Series:
+    """Calculate fantasy points for every player at once, with standard scoring by default"""
+    return _weighted_stat_sum(df, FANTASY_WEIGHTS if weights is None else weights)
+
+def calculate_per_vec(df: pd.DataFrame) -> pd.Series:
+    """Calculate Player Efficiency Rating for every player at once"""
+    return _weighted_stat_sum(df, PER_WEIGHTS)
+
+def calculate_usage_rate_vec(df: pd.DataFrame) -> np.ndarray:
+    """Calculate usage rate for every player at once"""
+    return _usage_rate(df)
+
+def calculate_weighted_fantasy_score_vec(df: pd.DataFrame) -> pd.Series:
+    """Calculate weighted fantasy score for every player at once"""
+    return _weighted_fantasy_score(df, df['Fantasy_Points'], df['PER'], df['Usage_Rate'])
+
+def compute_all_metrics(df: pd.DataFrame, fantasy_weights: Optional[Mapping[str, float]] = None) -> pd.DataFrame:
+    """Add Fantasy_Points, PER, Usage_Rate and Weighted_Fantasy_Score in one pass"""
+    # The weighted score reuses the other three columns instead of re-reading
+    # them from the frame
+    fantasy_points = calculate_fantasy_points_vec(df, fantasy_weights)
+    per = calculate_per_vec(df)
+    usage_rate = _usage_rate(df)
+    weighted_score = _weighted_fantasy_score(df, fantasy_points, per, usage_rate)
+    
+    return df.assign(Fantasy_Points=fantasy_points, PER=per, Usage_Rate=usage_rate,
+                     Weighted_Fantasy_Score=weighted_score)
+
+# Player summary fields: source column -> (summary key, default when missing)
+SUMMARY_FIELDS = {
+    'Player': ('name', 'Unknown'),
+    'Team': ('team', 'Unknown'),
+    'Pos': ('position', 'Unknown'),
+    'Age': ('age', 0),
+    'G': ('games', 0),
+    'Fantasy_Points': ('fantasy_points', 0.0),
+    'PTS': ('points', 0.0),
+    'TRB': ('rebounds', 0.0),
+    'AST': ('assists', 0.0),
+    'STL': ('steals', 0.0),
+    'BLK': ('blocks', 0.0),
+    'FG%': ('fg_percentage', 0.0),
+    '3P%': ('three_p_percentage', 0.0),
+    'FT%': ('ft_percentage', 0.0),
+    'TOV': ('turnovers', 0.0),
+    'eFG%': ('efg_percentage', 0.0),
+    'TS%': ('ts_percentage', 0.0),
+    'FTR': ('ftr', 0.0),
+    'AST_TOV_Ratio': ('ast_tov_ratio', 0.0),
+    'hAST%': ('hast_percentage', 0.0),
+    'TOV%': ('tov_percentage', 0.0),
+    'Player_Type': ('player_type', 'Other'),
+    'MP': ('minutes', 0.0),
+    'Game_Score': ('game_score', 0.0),
+    'BPM': ('bpm', 0.0)
+}
 
 def get_player_summary(player_data: pd.Series) -> Dict:
     """Get summary statistics for a player"""
-    # Helper function to safely get values with defaults
-    def safe_get(key, default=0.0):
-        try:
-            return player_data[key]
-        except KeyError:
-            return default
-    
+    # One reindex fetches every field; defaults only fill columns the row lacks
+    values = player_data.reindex(list(SUMMARY_FIELDS))
+    present = values.index.isin(player_data.index)
     return {
-        'name': safe_get('Player', 'Unknown'),
-        'team': safe_get('Team', 'Unknown'),
-        'position': safe_get('Pos', 'Unknown'),
-        'age': safe_get('Age', 0),
-        'games': safe_get('G', 0),
-        'fantasy_points': safe_get('Fantasy_Points', 0.0),
-        'points': safe_get('PTS', 0.0),
-        'rebounds': safe_get('TRB', 0.0),
-        'assists': safe_get('AST', 0.0),
-        'steals': safe_get('STL', 0.0),
-        'blocks': safe_get('BLK', 0.0),
-        'fg_percentage': safe_get('FG%', 0.0),
-        'three_p_percentage': safe_get('3P%', 0.0),
-        'ft_percentage': safe_get('FT%', 0.0),
-        'turnovers': safe_get('TOV', 0.0),
-        'efg_percentage': safe_get('eFG%', 0.0),
-        'ts_percentage': safe_get('TS%', 0.0),
-        'ftr': safe_get('FTR', 0.0),
-        'ast_tov_ratio': safe_get('AST_TOV_Ratio', 0.0),
-        'hast_percentage': safe_get('hAST%', 0.0),
-        'tov_percentage': safe_get('TOV%', 0.0),
-        'player_type': safe_get('Player_Type', 'Other'),
-        'minutes': safe_get('MP', 0.0),
-        'game_score': safe_get('Game_Score', 0.0),
-        'bpm': safe_get('BPM', 0.0)
+        key: value if is_present else default
+        for (key, default), value, is_present in zip(SUMMARY_FIELDS.values(), values, present)
     }
 
 
@@ -84,6 +130,14 @@ def format_stat(value: float, decimals: int = 1) -> str:
     """Format statistical values"""
     return f"{value:.{decimals}f}"
 
+def format_stat_series(values: pd.Series, decimals: int = 1) -> pd.Series:
+    """Format a column of statistical values, for vectorized string building
+    
+    A convenience wrapper that still formats element by element, so every
+    value rounds exactly like format_stat.
+    """
+    return values.map(f"{{:.{decimals}f}}".format)
+
 def get_filter_options(df: pd.DataFrame) -> Dict[str, List]:
     """Get available filter options from the dataset"""
     try:
@@ -105,54 +159,115 @@ def get_filter_options(df: pd.DataFrame) -> Dict[str, List]:
             'ppg_range': (0.0, 50.0)
         }
 
-def validate_filters(position: str, team: str, age_range: Tuple[int, int], min_games: int, ppg_range: Tuple[float, float]) -> bool:
-    """Validate filter inputs"""
-    if not isinstance(age_range, tuple) or len(age_range) != 2:
-        return False
-    if age_range[0] > age_range[1]:
-        return False
-    if min_games < 0:
-        return False
-    if not isinstance(ppg_range, tuple) or len(ppg_range) != 2:
-        return False
-    if ppg_range[0] > ppg_range[1]:
-        return False
-    if ppg_range[0] < 0 or ppg_range[1] < 0:
-        return False
-    return True
+@dataclass(frozen=True)
+class FilterSpec:
+    """Validated sidebar filter values
+    
+    Checked once when built, so code that receives a FilterSpec never has
+    to re-validate it. Invalid values raise ValueError.
+    """
+    position: str
+    team: str
+    age_lo: int
+    age_hi: int
+    min_games: int
+    ppg_lo: float
+    ppg_hi: float
+    
+    def __post_init__(self):
+        if self.age_lo > self.age_hi:
+            raise ValueError("Minimum age is greater than maximum age")
+        if self.min_games < 0:
+            raise ValueError("Minimum games cannot be negative")
+        if self.ppg_lo > self.ppg_hi:
+            raise ValueError("Minimum PPG is greater than maximum PPG")
+        if self.ppg_lo < 0 or self.ppg_hi < 0:
+            raise ValueError("PPG range cannot be negative")
+    
+    @classmethod
+    def from_inputs(cls, position: str, team: str, age_range: Tuple[int, int], min_games: int, ppg_range: Tuple[float, float]) -> 'FilterSpec':
+        """Build a FilterSpec from the sidebar widget values"""
+        # Cast to native Python scalars so numpy values never reach the cache
+        # hasher or the pandas comparisons in apply_filters
+        age_lo, age_hi = age_range
+        ppg_lo, ppg_hi = ppg_range
+        return cls(position, team, int(age_lo), int(age_hi), int(min_games), float(ppg_lo), float(ppg_hi))
+
+def _largest_positions(values: np.ndarray, n: int) -> np.ndarray:
+    """Get the positions of the n largest values, ordered like DataFrame.nlargest
+    
+    Ties keep their original order and NaNs only fill in after every other
+    value. Uses an O(N) partition to find the cutoff instead of sorting.
+    """
+    is_nan = np.isnan(values)
+    positions = np.flatnonzero(~is_nan)
+    n = max(n, 0)
+    k = min(n, len(positions))
+    if k == 0:
+        return np.flatnonzero(is_nan)[:n]
+    candidates = values[positions]
+    cutoff = np.partition(candidates, len(candidates) - k)[len(candidates) - k]
+    above = positions[candidates > cutoff]
+    ties = positions[candidates == cutoff][:k - len(above)]
+    chosen = np.concatenate([above, ties])
+    chosen = chosen[np.argsort(-values[chosen], kind='stable')]
+    return np.concatenate([chosen, np.flatnonzero(is_nan)[:n - k]])
 
 def get_top_performers(df: pd.DataFrame, metric: str, top_n: int = 10) -> pd.DataFrame:
     """Get top performers for a specific metric"""
-    return df.nlargest(top_n, metric)
+    return df.iloc[_largest_positions(df[metric].to_numpy(dtype=float), top_n)]
 
 def get_bottom_performers(df: pd.DataFrame, metric: str, bottom_n: int = 10) -> pd.DataFrame:
     """Get bottom performers for a specific metric"""
-    return df.nsmallest(bottom_n, metric)
+    return df.iloc[_largest_positions(-df[metric].to_numpy(dtype=float), bottom_n)]
 
 def calculate_team_efficiency(team_data: pd.DataFrame) -> Dict:
     """Calculate team efficiency metrics"""
+    # One batched aggregation instead of a separate pass per statistic
+    stats = team_data.agg({'Fantasy_Points': ['mean', 'sum'], 'Age': 'mean', 'G': 'mean'})
     return {
-        'avg_fantasy_points': team_data['Fantasy_Points'].mean(),
-        'total_fantasy_points': team_data['Fantasy_Points'].sum(),
+        'avg_fantasy_points': stats.at['mean', 'Fantasy_Points'],
+        'total_fantasy_points': stats.at['sum', 'Fantasy_Points'],
         'player_count': len(team_data),
-        'avg_age': team_data['Age'].mean(),
-        'avg_games': team_data['G'].mean()
+        'avg_age': stats.at['mean', 'Age'],
+        'avg_games': stats.at['mean', 'G']
     }
 
+def add_position_ranks(df: pd.DataFrame) -> pd.DataFrame:
+    """Add each player's fantasy points rank within their position"""
+    position_rank = df.groupby('Pos', observed=True)['Fantasy_Points'].rank(
+        method='first', ascending=False, na_option='bottom')
+    return df.assign(Position_Rank=position_rank.astype(int))
+
 def get_position_rankings(df: pd.DataFrame, position: str) -> pd.DataFrame:
-    """Get rankings for players in a specific position"""
-    position_players = df[df['Pos'] == position].copy()
-    position_players = position_players.sort_values('Fantasy_Points', ascending=False)
-    position_players['Position_Rank'] = range(1, len(position_players) + 1)
-    return position_players
+    """Get rankings for players in a specific position
+    
+    Pass a frame from add_position_ranks to reuse its ranks across positions
+    instead of ranking again on every call.
+    """
+    # Mask first so an unranked frame only has its position's rows ranked
+    # and copied, not the whole frame
+    position_players = df[df['Pos'] == position]
+    if 'Position_Rank' not in position_players.columns:
+        position_players = add_position_ranks(position_players)
+    return position_players.sort_values('Position_Rank')
 
 def calculate_consistency_score(player_data: pd.Series) -> float:
     """Calculate consistency score based on shooting percentages"""
-    shooting_stats = [player_data['FG%'], player_data['3P%'], player_data['FT%']]
-    # Higher consistency = less variance in shooting percentages
-    consistency = 1 - np.std(shooting_stats)
+    fg, three_p, ft = float(player_data['FG%']), float(player_data['3P%']), float(player_data['FT%'])
+    # Higher consistency = less variance in shooting percentages; population
+    # std of three values in plain float math, no array round-trip
+    mean = (fg + three_p + ft) / 3
+    variance = ((fg - mean) ** 2 + (three_p - mean) ** 2 + (ft - mean) ** 2) / 3
+    consistency = 1 - variance ** 0.5
     return max(0, consistency)  # Ensure non-negative
 
+def calculate_consistency_scores(df: pd.DataFrame) -> np.ndarray:
+    """Calculate consistency scores for every player at once"""
+    consistency = 1 - np.std(df[['FG%', '3P%', 'FT%']].to_numpy(dtype=float), axis=1)
+    # fmax matches max(0, nan) == 0 in the single-player version
+    return np.fmax(consistency, 0)
+
 def get_player_archetype(player_data: pd.Series) -> str:
     """Determine player archetype based on stats"""
     if player_data['AST'] > 7:
@@ -166,48 +281,89 @@ def get_player_archetype(player_data: pd.Series) -> str:
     else:
         return "Role Player"
 
+ARCHETYPES = ['Playmaker', 'Rebounder', 'Scorer', 'Defender', 'Role Player']
+
+def get_player_archetypes(df: pd.DataFrame) -> pd.Series:
+    """Determine every player's archetype at once, as a categorical column"""
+    # Conditions in the same priority order as get_player_archetype
+    conditions = [
+        df['AST'].to_numpy() > 7,
+        df['TRB'].to_numpy() > 10,
+        df['PTS'].to_numpy() > 25,
+        (df['STL'].to_numpy() + df['BLK'].to_numpy()) > 3
+    ]
+    archetypes = np.select(conditions, ARCHETYPES[:-1], default=ARCHETYPES[-1])
+    return pd.Series(pd.Categorical(archetypes, categories=ARCHETYPES), index=df.index, name='Archetype')
+
 def format_player_display_name(player_data: pd.Series) -> str:
     """Format player name for display"""
     return f"{player_data['Player']} ({player_data['Team']}) - {player_data['Pos']}"
 
-def get_stat_categories() -> Dict[str, List[str]]:
+def format_player_display_names(df: pd.DataFrame) -> pd.Series:
+    """Format every player's display name with vectorized string operations"""
+    # astype(str) also covers categorical Team/Pos columns, which don't support +
+    return df['Player'].astype(str) + ' (' + df['Team'].astype(str) + ') - ' + df['Pos'].astype(str)
+
+@lru_cache(maxsize=1)
+def get_stat_categories() -> Mapping[str, Tuple[str, ...]]:
     """Get predefined stat categories"""
-    return {
-        'scoring': ['PTS', 'FG%', '3P%', 'FT%'],
-        'rebounding': ['TRB', 'ORB', 'DRB'],
-        'playmaking': ['AST', 'TOV'],
-        'defense': ['STL', 'BLK'],
-        'efficiency': ['eFG%', 'PER', 'Usage_Rate'],
-        'advanced': ['Fantasy_Points', 'Weighted_Fantasy_Score']
-    }
+    # Built once and shared, so it is returned read-only
+    return MappingProxyType({
+        'scoring': ('PTS', 'FG%', '3P%', 'FT%'),
+        'rebounding': ('TRB', 'ORB', 'DRB'),
+        'playmaking': ('AST', 'TOV'),
+        'defense': ('STL', 'BLK'),
+        'efficiency': ('eFG%', 'PER', 'Usage_Rate'),
+        'advanced': ('Fantasy_Points', 'Weighted_Fantasy_Score')
+    })
+
+# League average keys and the columns they average
+LEAGUE_AVERAGE_COLUMNS = {
+    'avg_fantasy_points': 'Fantasy_Points',
+    'avg_points': 'PTS',
+    'avg_rebounds': 'TRB',
+    'avg_assists': 'AST',
+    'avg_steals': 'STL',
+    'avg_blocks': 'BLK',
+    'avg_fg_percentage': 'FG%',
+    'avg_three_p_percentage': '3P%',
+    'avg_ft_percentage': 'FT%'
+}
 
 def calculate_league_averages(df: pd.DataFrame) -> Dict:
     """Calculate league-wide averages"""
-    return {
-        'avg_fantasy_points': df['Fantasy_Points'].mean(),
-        'avg_points': df['PTS'].mean(),
-        'avg_rebounds': df['TRB'].mean(),
-        'avg_assists': df['AST'].mean(),
-        'avg_steals': df['STL'].mean(),
-        'avg_blocks': df['BLK'].mean(),
-        'avg_fg_percentage': df['FG%'].mean(),
-        'avg_three_p_percentage': df['3P%'].mean(),
-        'avg_ft_percentage': df['FT%'].mean()
-    }
+    # One mean over all nine columns instead of nine separate passes
+    means = df[list(LEAGUE_AVERAGE_COLUMNS.values())].mean()
+    return {key: means[col] for key, col in LEAGUE_AVERAGE_COLUMNS.items()}
 
 def get_percentile_rank(value: float, data: pd.Series) -> float:
     """Calculate percentile rank of a value in a dataset"""
     return (data < value).mean() * 100
 
-def create_player_rating(player_data: pd.Series, league_averages: Dict) -> Dict:
-    """Create overall player rating based on league averages"""
+def get_percentile_ranks(df: pd.DataFrame, stats: List[str]) -> pd.DataFrame:
+    """Calculate every player's percentile rank for several stats at once"""
+    # Same definition as get_percentile_rank (share of players strictly
+    # below), from one rank per column instead of one scan per player
+    return (df[stats].rank(method='min') - 1) / len(df) * 100
+
+def create_player_rating(player_data: pd.Series, league_averages: Dict,
+                         percentiles: Optional[pd.Series] = None) -> Dict:
+    """Create overall player rating based on league averages
+    
+    percentiles is the player's row of get_percentile_ranks; without it a
+    stat's percentile is 100 when the player beats the league average, else 0.
+    """
     ratings = {}
     
     for stat, avg in league_averages.items():
         if stat in player_data.index:
-            percentile = get_percentile_rank(player_data[stat], pd.Series([avg]))
+            value = player_data[stat]
+            if percentiles is not None and stat in percentiles.index:
+                percentile = percentiles[stat]
+            else:
+                percentile = 100.0 if avg < value else 0.0
             ratings[stat] = {
-                'value': player_data[stat],
+                'value': value,
                 'league_avg': avg,
                 'percentile': percentile
             }
@@ -27,9 +27,10 @@ def create_top_players_chart(df, top_n=10):
     fig.update_layout(yaxis={'categoryorder': 'total ascending'})
     return fig
 
-def create_player_type_pie_chart(df):
+def create_player_type_pie_chart(df, player_type_counts=None):
     """Create player type distribution pie chart"""
-    player_type_counts = df['Player_Type'].value_counts()
+    if player_type_counts is None:
+        player_type_counts = df['Player_Type'].value_counts()
     fig = px.pie(values=player_type_counts.values, 
                 names=player_type_counts.index,
                 title="Player Type Distribution")
@@ -47,21 +48,27 @@ def create_fantasy_vs_efficiency_scatter(df, top_n=50):
                     title=f"Fantasy Points vs Efficiency (Top {top_n} Players)")
     return fig
 
-def create_player_radar_chart(player_data, player_name, df):
+RADAR_CATEGORIES = ['PTS', 'TRB', 'AST', 'STL', 'BLK', 'FG%', '3P%', 'Efficiency']
+
+def get_radar_max_values(df):
+    """Get the league maxima used to normalize radar chart values"""
+    efficiency = df['PTS'] + df['TRB'] + df['AST'] + df['STL'] + df['BLK'] - df['TOV']
+    return np.append(df[RADAR_CATEGORIES[:-1]].max().to_numpy(dtype=float), efficiency.max())
+
+def create_player_radar_chart(player_data, player_name, df, max_values=None):
     """Create performance radar chart for individual player"""
-    categories = ['PTS', 'TRB', 'AST', 'STL', 'BLK', 'FG%', '3P%', 'Efficiency']
+    categories = RADAR_CATEGORIES
     
     # Calculate efficiency (PER)
     efficiency = player_data['PTS'] + player_data['TRB'] + player_data['AST'] + player_data['STL'] + player_data['BLK'] - player_data['TOV']
     
     values = [player_data[cat] for cat in categories[:-1]] + [efficiency]
     
-    # Normalize values for radar chart
-    max_values = df[categories[:-1]].max()
-    max_efficiency = df['PTS'] + df['TRB'] + df['AST'] + df['STL'] + df['BLK'] - df['TOV']
-    max_values = max_values.tolist() + [max_efficiency.max()]
+    # Normalize values for radar chart (maxima can be precomputed once per dataset)
+    if max_values is None:
+        max_values = get_radar_max_values(df)
     
-    normalized_values = [val / max_val * 100 for val, max_val in zip(values, max_values)]
+    normalized_values = (np.asarray(values, dtype=float) / max_values * 100).tolist()
     
     # Close the line by adding the first point at the end
     closed_values = normalized_values + [normalized_values[0]]
@@ -89,9 +96,9 @@ def create_player_radar_chart(player_data, player_name, df):
     
     return fig
 
-def create_multi_player_radar_chart(players_data, player_names, df):
+def create_multi_player_radar_chart(players_data, player_names, df, max_values=None):
     """Create performance radar chart for multiple players comparison"""
-    categories = ['PTS', 'TRB', 'AST', 'STL', 'BLK', 'FG%', '3P%', 'Efficiency']
+    categories = RADAR_CATEGORIES
     
     # Calculate efficiency (PER) for all players
     efficiency_values = []
@@ -100,9 +107,8 @@ def create_multi_player_radar_chart(players_data, player_names, df):
         efficiency_values.append(efficiency)
     
     # Normalize values for radar chart
-    max_values = df[categories[:-1]].max()
-    max_efficiency = df['PTS'] + df['TRB'] + df['AST'] + df['STL'] + df['BLK'] - df['TOV']
-    max_values = max_values.tolist() + [max_efficiency.max()]
+    if max_values is None:
+        max_values = get_radar_max_values(df)
     
     fig = go.Figure()
     
@@ -111,7 +117,7 @@ def create_multi_player_radar_chart(players_data, player_names, df):
     
     for i, (player_data, player_name) in enumerate(zip(players_data, player_names)):
         values = [player_data[cat] for cat in categories[:-1]] + [efficiency_values[i]]
-        normalized_values = [val / max_val * 100 for val, max_val in zip(values, max_values)]
+        normalized_values = (np.asarray(values, dtype=float) / max_values * 100).tolist()
         
         # Close the line by adding the first point at the end
         closed_values = normalized_values + [normalized_values[0]]
@@ -187,10 +193,12 @@ def create_advanced_stats_scatter(df, x_stat, y_stat):
 def create_correlation_heatmap(df):
     """Create correlation heatmap for statistical analysis"""
     numeric_cols = ['PTS', 'TRB', 'AST', 'STL', 'BLK', 'FG%', '3P%', 'FT%', 'Fantasy_Points']
-    corr_matrix = df[numeric_cols].corr()
+    # Display-only: float32 halves the matrix payload and the cell labels
+    # only need two decimals
+    corr_matrix = df[numeric_cols].corr().astype(np.float32)
     
     fig = px.imshow(corr_matrix, 
-                   text_auto=True, 
+                   text_auto='.2f', 
                    aspect="auto",
                    title="Statistical Correlations",
                    color_continuous_scale='RdBu')
@@ -224,11 +232,14 @@ def create_team_analysis_chart(team_stats, chart_type='avg', top_n=15):
 
 def create_metric_cards_data(df):
     """Prepare data for metric cards display"""
+    # Positional argmax on the raw arrays instead of idxmax + label lookups;
+    # nanargmax skips missing values like idxmax does
+    players = df['Player'].to_numpy()
     metrics = {
         'total_players': len(df),
         'avg_fantasy': df['Fantasy_Points'].mean(),
-        'top_scorer': df.loc[df['PTS'].idxmax(), 'Player'],
-        'most_efficient': df.loc[df['PER'].idxmax(), 'Player']
+        'top_scorer': players[np.nanargmax(df['PTS'].to_numpy(dtype=float))],
+        'most_efficient': players[np.nanargmax(df['PER'].to_numpy(dtype=float))]
     }
     return metrics
 
@@ -239,15 +250,17 @@ def create_player_comparison_chart(players_data):
     
     categories = ['PTS', 'TRB', 'AST', 'STL', 'BLK', 'FG%', '3P%', 'FT%']
     
+    # Players x categories matrix, normalized by each category's maximum
+    # across the compared players in one array operation
+    values = np.array([[player_data[cat] for cat in categories] for player_data in players_data.values()],
+                      dtype=float)
+    normalized = values / np.nanmax(values, axis=0) * 100
+    
     fig = go.Figure()
     
-    for player_name, player_data in players_data.items():
-        values = [player_data[cat] for cat in categories]
-        max_values = [max([p[cat] for p in players_data.values()]) for cat in categories]
-        normalized_values = [val / max_val * 100 for val, max_val in zip(values, max_values)]
-        
+    for player_name, normalized_values in zip(players_data, normalized):
         fig.add_trace(go.Scatterpolar(
-            r=normalized_values,
+            r=normalized_values.tolist(),
             theta=categories,
             fill='toself',
             name=player_name
@@ -265,16 +278,34 @@ def create_player_comparison_chart(players_data):
     
     return fig
 
+# Age group bin edges (right-inclusive) and their labels
+AGE_GROUP_EDGES = [0, 22, 25, 28, 31, 100]
+AGE_GROUP_LABELS = ['21-22', '23-25', '26-28', '29-31', '32+']
+
 def create_trend_analysis_chart(df, metric='Fantasy_Points', group_by='Pos'):
     """Create trend analysis chart"""
     if group_by == 'Pos':
-        trend_data = df.groupby('Pos')[metric].mean().reset_index()
+        trend_data = df.groupby('Pos', observed=True)[metric].mean().reset_index()
         fig = px.bar(trend_data, x='Pos', y=metric, title=f"Average {metric} by Position")
     elif group_by == 'Age':
-        # Create age groups
-        df['Age_Group'] = pd.cut(df['Age'], bins=[0, 22, 25, 28, 31, 100], 
-                                labels=['21-22', '23-25', '26-28', '29-31', '32+'])
-        trend_data = df.groupby('Age_Group')[metric].mean().reset_index()
+        # Bin ages with digitize and average with bincount rather than adding
+        # a pd.cut column to the caller's frame and grouping on it
+        ages = df['Age'].to_numpy(dtype=float)
+        values = df[metric].to_numpy(dtype=float)
+        in_range = (ages > AGE_GROUP_EDGES[0]) & (ages <= AGE_GROUP_EDGES[-1])
+        codes = np.digitize(ages[in_range], AGE_GROUP_EDGES[1:-1], right=True)
+        values = values[in_range]
+        has_value = ~np.isnan(values)
+        
+        n_groups = len(AGE_GROUP_LABELS)
+        players = np.bincount(codes, minlength=n_groups)
+        counts = np.bincount(codes[has_value], minlength=n_groups)
+        sums = np.bincount(codes[has_value], weights=values[has_value], minlength=n_groups)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = sums / counts
+        
+        present = players > 0
+        trend_data = pd.DataFrame({'Age_Group': np.array(AGE_GROUP_LABELS)[present], metric: means[present]})
         fig = px.bar(trend_data, x='Age_Group', y=metric, title=f"Average {metric} by Age Group")
     
     return fig